@@ -0,0 +1,100 @@
+"""
+Micro-benchmark of listing field extraction.
+
+Compares the old cascade of select_one calls with the single-pass
+ExtractionPlan on synthetic listing pages, after checking that both find
+the same elements. With --parser selectolax the plan falls back to lexbor's
+own selector engine, so both sides run roughly the same code there.
+
+Usage:
+    python -m benchmarks.bench_extraction [--pages N] [--parser PARSER] [--repeat N]
+"""
+
+import argparse
+import time
+from typing import Any, Dict
+
+from benchmarks.synthetic import listing_page
+from src.parsers import PARSERS, make_soup
+from src.scraper import (
+    LISTING_PLAN, TITLE_SELECTORS, COMPANY_SELECTOR, COUNTRY_SELECTOR, CITY_SELECTOR,
+    DURATION_SELECTORS, POST_DATE_SELECTORS, DEADLINE_SELECTOR, DEADLINE_ITEM_SELECTORS, FIELD_SELECTOR,
+)
+
+
+def first(selectors, lookup):
+    """Get the first element found by a list of alternative selectors."""
+    for selector in selectors:
+        elem = lookup(selector)
+        if elem is not None:
+            return elem
+    return None
+
+
+def extract_with_select_one(container) -> Dict[str, Any]:
+    """Find the field elements of a listing with one select_one call per selector."""
+    deadline_container = container.select_one(DEADLINE_SELECTOR)
+    return {
+        "title": first(TITLE_SELECTORS, container.select_one),
+        "company": container.select_one(COMPANY_SELECTOR),
+        "country": container.select_one(COUNTRY_SELECTOR),
+        "city": container.select_one(CITY_SELECTOR),
+        "duration": first(DURATION_SELECTORS, container.select_one),
+        "post_date": first(POST_DATE_SELECTORS, container.select_one),
+        "deadline": first(DEADLINE_ITEM_SELECTORS, deadline_container.select_one) if deadline_container else None,
+        "field": container.select_one(FIELD_SELECTOR),
+    }
+
+
+def extract_with_plan(container) -> Dict[str, Any]:
+    """Find the field elements of a listing in a single pass."""
+    found = LISTING_PLAN.first_matches(container)
+    return {
+        "title": first(TITLE_SELECTORS, found.get),
+        "company": found.get(COMPANY_SELECTOR),
+        "country": found.get(COUNTRY_SELECTOR),
+        "city": found.get(CITY_SELECTOR),
+        "duration": first(DURATION_SELECTORS, found.get),
+        "post_date": first(POST_DATE_SELECTORS, found.get),
+        "deadline": first(DEADLINE_ITEM_SELECTORS, lambda s: found.get((DEADLINE_SELECTOR, s))),
+        "field": found.get(FIELD_SELECTOR),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark listing field extraction")
+    parser.add_argument("--pages", type=int, default=10, help="Number of synthetic listing pages")
+    parser.add_argument("--parser", choices=PARSERS, default="html.parser", help="HTML parser backend")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs (the best is reported)")
+    args = parser.parse_args()
+
+    containers = []
+    for page in range(args.pages):
+        soup = make_soup(listing_page(page), args.parser)
+        containers.extend(soup.select('.media-list-items'))
+
+    # Both approaches have to find exactly the same elements
+    for container in containers:
+        expected = extract_with_select_one(container)
+        actual = extract_with_plan(container)
+        for key in expected:
+            if str(expected[key]) != str(actual[key]):
+                raise SystemExit(f"Mismatch for {key}: {expected[key]} != {actual[key]}")
+
+    print(f"{len(containers)} listings, parser {args.parser}")
+    results = {}
+    for name, extract in (("select_one cascade", extract_with_select_one), ("single pass", extract_with_plan)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for container in containers:
+                extract(container)
+            best = min(best, time.perf_counter() - start)
+        results[name] = best / len(containers)
+        print(f"  {name:<20} {results[name] * 1e6:8.1f} µs per listing")
+
+    print(f"  speedup              {results['select_one cascade'] / results['single pass']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
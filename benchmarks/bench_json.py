@@ -0,0 +1,82 @@
+"""
+Benchmark of saving and loading traineeships as JSON.
+
+Compares the indented stdlib json.dump the scraper used to write with
+compact JSON from every library src.jsonio can use (orjson and msgspec when
+installed, the standard library otherwise), on a dataset from the data
+directory, after checking that they all decode to the same records.
+
+Usage:
+    python -m benchmarks.bench_json [--file FILE] [--scale N] [--repeat N]
+"""
+
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+
+from src import jsonio
+
+
+def best_time(func, repeat: int) -> float:
+    """Run a function `repeat` times and return the fastest run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark saving and loading traineeships as JSON")
+    parser.add_argument("--file", default=None,
+                        help="JSON dataset to use (default: the most recent one in data/)")
+    parser.add_argument("--scale", type=int, default=1, help="Repeat the dataset this many times")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs (the best is reported)")
+    args = parser.parse_args()
+
+    path = args.file or max(glob.glob(os.path.join("data", "erasmusintern_traineeships_*.json")), default=None)
+    if not path:
+        raise SystemExit("No dataset found, pass one with --file")
+    with open(path, encoding="utf-8") as f:
+        traineeships = json.load(f) * args.scale
+
+    # How the scraper saved JSON before, then each library writing compact bytes
+    variants = {"json indent=4": lambda obj: json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")}
+    for name, (dumpb, _) in jsonio.BACKENDS.items():
+        variants[f"{name} compact"] = dumpb
+
+    print(f"{len(traineeships)} traineeships from {path}, default backend {jsonio.BACKEND}")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name, dumpb in variants.items():
+            out = os.path.join(tmp, "out.json")
+
+            def save():
+                with open(out, "wb") as f:
+                    f.write(dumpb(traineeships))
+
+            save_time = best_time(save, args.repeat)
+            size = os.path.getsize(out)
+            with open(out, "rb") as f:
+                data = f.read()
+
+            loads = jsonio.BACKENDS[name.split()[0]][1]
+            if loads(data) != traineeships:
+                raise SystemExit(f"{name} doesn't round-trip the dataset")
+            load_time = best_time(lambda: loads(data), args.repeat)
+            results[name] = (save_time, load_time)
+            print(f"  {name:<16} save {save_time * 1000:8.1f} ms   load {load_time * 1000:8.1f} ms   "
+                  f"{size / (1024 * 1024):6.2f} MB")
+
+    baseline_save, baseline_load = results["json indent=4"]
+    fast_save, fast_load = results[f"{jsonio.BACKEND} compact"]
+    print(f"  speedup of {jsonio.BACKEND} compact: save {baseline_save / fast_save:.1f}x, "
+          f"load {baseline_load / fast_load:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Benchmark of the scraper on recorded or synthetic pages.
+
+Measures the parse time per listing page and per detail page, end-to-end
+records/sec of a crawl replayed from an archive (so no network is involved),
+the time to save the results, and the peak memory of the process. With
+--output the results are written as JSON, together with the commit they
+were measured on, so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.bench_scraper [--archive DIR] [--pages N] [--parser PARSER]
+        [--detail-workers N] [--repeat N] [--output FILE]
+
+Without --archive, a synthetic crawl of --pages listing pages is generated.
+Record a real one with `python main.py scrape --record DIR`.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.synthetic import detail_page, listing_page
+from src.archive import ArchiveMiss, ResponseArchive
+from src.parsers import PARSERS
+from src.records import Traineeship
+from src.scraper import ErasmusInternScraper, parse_detail_page, parse_listing_page
+
+SYNTHETIC_BASE_URL = "https://erasmusintern.org/traineeships"
+
+
+def build_synthetic_archive(path: str, pages: int) -> None:
+    """Write a synthetic crawl of the given number of listing pages to an archive."""
+    archive = ResponseArchive(path, SYNTHETIC_BASE_URL)
+    for page in range(pages):
+        archive.save(f"{SYNTHETIC_BASE_URL}?page={page}",
+                     listing_page(page, total_pages=pages, base_url="https://erasmusintern.org"))
+        for i in range(20):
+            n = page * 20 + i
+            archive.save(f"https://erasmusintern.org/traineeship/synthetic-traineeship-{n}", detail_page(n))
+
+
+def load_crawl(path: str, data_dir: str, parser: str,
+               max_pages: int) -> Tuple[List[Tuple[int, str]], List[Tuple[Traineeship, str]]]:
+    """
+    Load the listing and detail pages of an archived crawl.
+
+    Args:
+        path: Directory of the archive
+        data_dir: Data directory for the scraper replaying the archive
+        parser: HTML parser backend used to find the detail pages
+        max_pages: Number of listing pages to load (0 for all)
+
+    Returns:
+        The (page number, HTML) of every listing page and the (traineeship, HTML)
+        of every detail page
+    """
+    scraper = ErasmusInternScraper(data_dir=data_dir, rate_limit=0, replay_dir=path)
+
+    listings = []
+    details = []
+    page_num = 1
+    total_pages = None
+    while total_pages is None or page_num <= total_pages:
+        try:
+            html = scraper._fetch(scraper._page_url(page_num))
+        except ArchiveMiss:
+            break
+        page = parse_listing_page(html, page_num, parser)
+        if total_pages is None:
+            total_pages = min(page["total_pages"], max_pages) if max_pages else page["total_pages"]
+        listings.append((page_num, html))
+        for traineeship in page["traineeships"]:
+            try:
+                details.append((traineeship, scraper._fetch(traineeship.url)))
+            except ArchiveMiss:
+                pass
+        page_num += 1
+    return listings, details
+
+
+def best_time(func, repeat: int) -> float:
+    """Run a function `repeat` times and return the fastest run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in megabytes, or None where it can't be read."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_commit() -> Optional[str]:
+    """Commit of the working tree, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper on recorded or synthetic pages")
+    parser.add_argument("--archive", default=None, help="Archive recorded with main.py scrape --record")
+    parser.add_argument("--pages", type=int, default=20,
+                        help="Number of listing pages (synthetic pages, or the first pages of the archive)")
+    parser.add_argument("--parser", choices=PARSERS, default="html.parser", help="HTML parser backend")
+    parser.add_argument("--detail-workers", type=int, default=1, help="Threads fetching detail pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs (the best is reported)")
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    # The scraper logs every page it fetches, which isn't what is being measured
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive_dir = args.archive
+        if not archive_dir:
+            archive_dir = os.path.join(tmp, "archive")
+            build_synthetic_archive(archive_dir, args.pages)
+
+        listings, details = load_crawl(archive_dir, os.path.join(tmp, "data"), args.parser, args.pages)
+        if not listings:
+            raise SystemExit(f"No listing pages found in {archive_dir}")
+
+        results: Dict[str, Any] = {}
+        listing_time = best_time(lambda: [parse_listing_page(html, n, args.parser) for n, html in listings],
+                                 args.repeat)
+        detail_time = best_time(lambda: [parse_detail_page(html, t, args.parser) for t, html in details],
+                                args.repeat) if details else 0.0
+        results["listing_page_parse_ms"] = listing_time / len(listings) * 1000
+        results["detail_page_parse_ms"] = detail_time / len(details) * 1000 if details else None
+
+        def crawl():
+            scraper = ErasmusInternScraper(data_dir=os.path.join(tmp, "data"), rate_limit=0,
+                                           parser=args.parser, replay_dir=archive_dir)
+            crawl.traineeships = scraper.scrape_all(max_pages=len(listings), detail_workers=args.detail_workers)
+            crawl.scraper = scraper
+
+        crawl_time = best_time(crawl, args.repeat)
+        traineeships = crawl.traineeships
+        results["records"] = len(traineeships)
+        results["records_per_sec"] = len(traineeships) / crawl_time
+        results["pages_per_sec"] = (len(listings) + len(traineeships)) / crawl_time
+
+        csv_file = os.path.join(tmp, "data", "bench.csv")
+        json_file = os.path.join(tmp, "data", "bench.json")
+        results["save_to_csv_ms"] = best_time(lambda: crawl.scraper.save_to_csv(traineeships, csv_file),
+                                              args.repeat) * 1000
+        results["save_to_json_ms"] = best_time(lambda: crawl.scraper.save_to_json(traineeships, json_file),
+                                               args.repeat) * 1000
+        results["peak_rss_mb"] = peak_rss_mb()
+
+    print(f"{len(listings)} listing pages, {len(details)} detail pages, parser {args.parser}")
+    print(f"  listing page parse   {results['listing_page_parse_ms']:8.2f} ms")
+    if details:
+        print(f"  detail page parse    {results['detail_page_parse_ms']:8.2f} ms")
+    print(f"  crawl                {results['records_per_sec']:8.1f} records/s ({results['pages_per_sec']:.1f} pages/s)")
+    print(f"  save_to_csv          {results['save_to_csv_ms']:8.1f} ms")
+    print(f"  save_to_json         {results['save_to_json_ms']:8.1f} ms")
+    if results["peak_rss_mb"] is not None:
+        print(f"  peak RSS             {results['peak_rss_mb']:8.1f} MB")
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "source": args.archive or "synthetic",
+            "parser": args.parser,
+            "detail_workers": args.detail_workers,
+            "listing_pages": len(listings),
+            "detail_pages": len(details),
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+A local stand-in for erasmusintern.org, for load tests.
+
+Serves synthetic listing pages with the real markup at /traineeships?page=N
+and matching detail pages at /traineeship/synthetic-traineeship-N, with
+configurable latency, server errors and 429 responses. Detail pages carry an
+ETag, so the scraper's cache can revalidate them.
+
+Usage:
+    python -m benchmarks.mock_server [--listings N] [--per-page N] [--latency S]
+        [--error-rate P] [--throttle-rate P] [--retry-after S] [--port PORT]
+
+Then point the scraper at it:
+    BASE_URL=http://127.0.0.1:8000/traineeships python main.py scrape
+"""
+
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import detail_page, listing_page
+
+LISTING_PATH = "/traineeships"
+DETAIL_PATH = "/traineeship/synthetic-traineeship-"
+
+
+class MockServer:
+    """A synthetic erasmusintern.org served from a background thread."""
+
+    def __init__(self, listings: int = 1000, per_page: int = 20, latency: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, retry_after: int = 1,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server.
+
+        Args:
+            listings: Total number of listings
+            per_page: Number of listings on a listing page
+            latency: Mean response time in seconds (each response takes between
+                half and one and a half times as long)
+            error_rate: Fraction of requests answered with 500 or 503
+            throttle_rate: Fraction of requests answered with 429
+            retry_after: Retry-After header of 429 and 503 responses, in seconds
+            host: Address to listen on
+            port: Port to listen on (0 for any free port)
+        """
+        self.listings = listings
+        self.per_page = per_page
+        self.total_pages = max(1, -(-listings // per_page))
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+
+        self._lock = threading.Lock()
+        # Number of responses by status code
+        self.responses: Dict[int, int] = {}
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """URL of the first listing page, to use as the scraper's base URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{LISTING_PATH}"
+
+    def start(self) -> "MockServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the current thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _count(self, status: int) -> None:
+        with self._lock:
+            self.responses[status] = self.responses.get(status, 0) + 1
+
+    def _handler(self):
+        """Build the request handler class bound to this server's settings."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive like the real site does
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, which Nagle's algorithm
+            # would hold back until the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def handle(self):
+                try:
+                    super().handle()
+                except (ConnectionResetError, BrokenPipeError):
+                    # The client stopped reading, as --stream-details does once
+                    # it has found the fields it needs
+                    pass
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency * random.uniform(0.5, 1.5))
+
+                roll = random.random()
+                if roll < server.throttle_rate:
+                    return self._send(429, "Too Many Requests", {"Retry-After": str(server.retry_after)})
+                if roll < server.throttle_rate + server.error_rate:
+                    status = random.choice((500, 503))
+                    headers = {"Retry-After": str(server.retry_after)} if status == 503 else {}
+                    return self._send(status, "Server Error", headers)
+
+                url = urlparse(self.path)
+                base_url = f"http://{self.headers.get('Host', 'localhost')}"
+                if url.path == LISTING_PATH:
+                    try:
+                        page = int(parse_qs(url.query).get("page", ["0"])[0])
+                    except ValueError:
+                        page = 0
+                    if not 0 <= page < server.total_pages:
+                        return self._send(404, "Not Found")
+                    html = listing_page(page, per_page=server.per_page, total_pages=server.total_pages,
+                                        base_url=base_url, path=LISTING_PATH,
+                                        count=min(server.per_page, server.listings - page * server.per_page))
+                    return self._send(200, html)
+
+                if url.path.startswith(DETAIL_PATH):
+                    try:
+                        n = int(url.path[len(DETAIL_PATH):])
+                    except ValueError:
+                        return self._send(404, "Not Found")
+                    etag = f'"synthetic-{n}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        return self._send(304, "")
+                    return self._send(200, detail_page(n), {"ETag": etag})
+
+                return self._send(404, "Not Found")
+
+            def _send(self, status, body, headers=None):
+                server._count(status)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                if status != 304:
+                    self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if status != 304:
+                    self.wfile.write(data)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic erasmusintern.org for load tests")
+    parser.add_argument("--listings", type=int, default=1000, help="Total number of listings")
+    parser.add_argument("--per-page", type=int, default=20, help="Listings per listing page")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response time in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500 or 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After of 429 and 503 responses in seconds")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    args = parser.parse_args()
+
+    server = MockServer(listings=args.listings, per_page=args.per_page, latency=args.latency,
+                        error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                        retry_after=args.retry_after, host=args.host, port=args.port)
+    print(f"Serving {args.listings} listings on {server.total_pages} pages at {server.url}")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Responses by status: {dict(sorted(server.responses.items()))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Synthetic erasmusintern.org pages for benchmarks and load tests."""
+
+import random
+from html import escape
+from typing import Optional
+
+COUNTRIES = ["Greece", "Spain", "Germany", "Italy", "Portugal", "France", "Poland", "Belgium"]
+CITIES = ["Athens", "Madrid", "Berlin", "Rome", "Lisbon", "Paris", "Warsaw", "Brussels"]
+FIELDS = [
+    "Engineering and/or Technology",
+    "Business Studies and/or Management Science",
+    "Communication and Information Sciences",
+    "Computer Science",
+    "Arts and Design",
+]
+DURATIONS = ["2 months", "3 months", "4 months", "6 months", "12 months"]
+
+PAGE_HEADER = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Traineeships | Erasmus Intern</title>
+<script>window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);}</script>
+<link rel="stylesheet" href="/sites/all/themes/erasmusintern/css/style.css"></head>
+<body class="html not-front page-traineeships">
+<header id="navbar"><nav class="navbar"><ul class="menu nav">
+<li><a href="/">Home</a></li><li><a href="/traineeships">Traineeships</a></li>
+<li><a href="/organisations">Organisations</a></li><li><a href="/user/login">Log in</a></li>
+</ul></nav></header>
+<div class="main-container container"><section class="col-sm-12">
+"""
+
+PAGE_FOOTER = """</section></div>
+<footer class="footer container"><div class="region region-footer">
+<p>Erasmus Intern is an initiative of the Erasmus Student Network.</p>
+<ul class="menu"><li><a href="/about">About</a></li><li><a href="/contact">Contact</a></li></ul>
+</div></footer>
+<script src="/misc/jquery.js"></script><script>jQuery.extend(Drupal.settings, {"basePath": "/"});</script>
+</body></html>
+"""
+
+
+def listing_item(n: int, base_url: str = "") -> str:
+    """HTML of the n-th listing, using the markup of the real listing pages."""
+    rng = random.Random(n)
+    city = f"""<div class="field field-name-field-traineeship-location-city"><div class="field-items"><div class="field-item even">{rng.choice(CITIES)}</div></div></div>""" if n % 3 else ""
+    post_date = f"""<div class="field field-name-post-date field-type-ds field-label-inline clearfix"><div class="field-label">Post date:&nbsp;</div><div class="field-items"><div class="field-item even">{rng.randint(1, 28)} Feb, 2025</div></div></div>""" if n % 7 else ""
+    return f"""<div class="media-list-items ds-2col-stacked node node-traineeship view-mode-teaser clearfix">
+<div class="group-header ds-top-content"><h5>{escape(rng.choice(FIELDS))}</h5>
+<h3 class="dot-title"><a href="{base_url}/traineeship/synthetic-traineeship-{n}">Synthetic Traineeship {n} &amp; Co</a></h3></div>
+<div class="group-left media-body">
+<div class="field field-name-recruiter-name field-type-ds"><div class="field-items"><div class="field-item even"><a href="/organisation/company-{n % 97}">Company {n % 97}</a></div></div></div>
+<div class="field field-name-field-traineeship-location-count field-type-list-text"><div class="field-items"><div class="field-item even">{rng.choice(COUNTRIES)}</div></div></div>
+{city}
+</div>
+<div class="group-footer ds-top-footer">
+<div class="field field-name-field-traineeship-duration field-type-taxonomy-term-reference field-label-inline clearfix"><div class="field-label">Duration:&nbsp;</div><div class="field-items"><div class="field-item even">{rng.choice(DURATIONS)}</div></div></div>
+{post_date}
+<div class="field field-name-field-traineeship-apply-deadline field-type-datetime field-label-inline clearfix"><div class="field-label">Deadline:&nbsp;</div><div class="field-items"><div class="field-item even"><span class="date-display-single">{rng.randint(1, 28)} Mar, 2025</span></div></div></div>
+</div>
+</div>
+"""
+
+
+def listing_page(page: int, per_page: int = 20, total_pages: int = 42, base_url: str = "",
+                 path: str = "/traineeships", count: Optional[int] = None) -> str:
+    """
+    HTML of a listing page.
+
+    Args:
+        page: Zero-based page number, as in the ?page= parameter
+        per_page: Number of listings on the page
+        total_pages: Number of pages the pager links to
+        base_url: Scheme and host for the detail page links (empty for relative links)
+        path: Path of the listing pages, used by the pager
+        count: Number of listings actually on the page, if fewer than per_page
+    """
+    count = per_page if count is None else count
+    items = "".join(listing_item(page * per_page + i, base_url) for i in range(count))
+    pager = [f'<li class="pager-current first">{page + 1}</li>']
+    for p in range(page + 1, min(page + 5, total_pages)):
+        pager.append(f'<li class="pager-item"><a href="{path}?page={p}">{p + 1}</a></li>')
+    if page < total_pages - 1:
+        pager.append(f'<li class="pager-next"><a href="{path}?page={page + 1}">next ›</a></li>')
+        pager.append(f'<li class="pager-last last"><a href="{path}?page={total_pages - 1}">last »</a></li>')
+    return (PAGE_HEADER
+            + f'<div class="view view-traineeships"><div class="view-content">{items}</div>'
+            + f'<div class="text-center"><ul class="pager">{"".join(pager)}</ul></div></div>'
+            + PAGE_FOOTER)
+
+
+def detail_page(n: int, comments: Optional[int] = None) -> str:
+    """
+    HTML of the detail page of the n-th listing.
+
+    Args:
+        n: Number of the listing
+        comments: Number of comments below the description (random if None)
+    """
+    rng = random.Random(n)
+    paragraphs = "".join(
+        f"<p>Paragraph {i} of the description of synthetic traineeship {n}. "
+        "You will work with a small team on real projects and learn a lot along the way.</p>"
+        for i in range(rng.randint(3, 8))
+    )
+    if comments is None:
+        comments = rng.randint(0, 40)
+    thread = "".join(
+        f'<div class="comment"><div class="submitted">User {i}</div><p>Is this traineeship still open? #{i}</p></div>'
+        for i in range(comments)
+    )
+    return (PAGE_HEADER
+            + f'<h1 class="page-header">Synthetic Traineeship {n} &amp; Co</h1>'
+            + '<div class="node node-traineeship view-mode-full">'
+            + f'<div class="field field-name-body field-type-text-with-summary"><div class="field-items"><div class="field-item even">{paragraphs}</div></div></div>'
+            + '</div>'
+            + f'<section class="comments">{thread}</section>'
+            + PAGE_FOOTER)
@@ -3,12 +3,26 @@
 import os
 import sys
 import argparse
+import asyncio
 import json
+import logging
 import traceback
+from datetime import datetime
 from typing import Dict, Any, List  # Add missing imports for type hints
 
-from src.scraper import ErasmusInternScraper
-from src.utils import load_config, validate_config
+from src.db import TraineeshipStore
+from src.log import setup_logging
+from src.parquet import ParquetStreamWriter
+from src.parsers import PARSERS
+from src.retry import CrawlAborted
+from src.scraper import ErasmusInternScraper, LISTING_FIELDS, DETAIL_FIELDS
+from src.utils import load_config, validate_config, get_most_recent_data_file, load_traineeships
+from src.writers import StreamWriter, CsvStreamWriter, JsonStreamWriter, JsonLinesStreamWriter
+
+
+# Formats of the data file saved next to the CSV, by file extension
+FORMAT_NAMES = {"json": "JSON", "jsonl": "JSON Lines", "jsonl.gz": "JSON Lines", "jsonl.zst": "JSON Lines",
+                "parquet": "Parquet"}
 
 
 def setup_argparse() -> argparse.ArgumentParser:
@@ -29,6 +43,54 @@ def setup_argparse() -> argparse.ArgumentParser:
                       help="Skip fetching detailed information for each traineeship")
     scrape_parser.add_argument("--output", type=str, default=None,
                       help="Output filename (default: erasmusintern_traineeships_YYYY-MM-DD.csv)")
+    scrape_parser.add_argument("--format", choices=list(FORMAT_NAMES), default="json",
+                      help="Format of the file saved next to the CSV: a JSON array, JSON Lines written "
+                           "as listings are scraped and kept if the crawl fails (optionally gzip or zstd "
+                           "compressed), or Parquet with dictionary-encoded columns")
+    scrape_parser.add_argument("--pretty", action="store_true",
+                      help="Indent the JSON file by four spaces instead of writing it compactly")
+    scrape_parser.add_argument("--db", action="store_true",
+                      help="Also save the traineeships to the SQLite database DB_PATH, updating the ones "
+                           "stored before. With --incremental, known traineeships are looked up in it")
+    scrape_parser.add_argument("--incremental", action="store_true",
+                      help="Only scrape traineeships posted since the most recent dataset in the data directory")
+    scrape_parser.add_argument("--no-cache", action="store_true",
+                      help="Don't reuse or store cached detail pages")
+    scrape_parser.add_argument("--resume", action="store_true",
+                      help="Continue an interrupted crawl, skipping the pages and details it already fetched")
+    scrape_parser.add_argument("--parser", choices=PARSERS, default=None,
+                      help="HTML parser backend (default: HTML_PARSER from the configuration)")
+    scrape_parser.add_argument("--parse-workers", type=int, default=0,
+                      help="Number of processes parsing pages (0 parses them in the main process)")
+    scrape_parser.add_argument("--stream-details", action="store_true",
+                      help="Stop downloading a detail page once the fields the scraper needs have been read")
+    archive_group = scrape_parser.add_mutually_exclusive_group()
+    archive_group.add_argument("--record", metavar="DIR", default=None,
+                      help="Record every downloaded page to a compressed archive in DIR")
+    archive_group.add_argument("--replay", metavar="DIR", default=None,
+                      help="Serve every page from an archive recorded with --record, without any network")
+    scrape_parser.add_argument("--detail-workers", type=int, default=1,
+                      help="Number of threads fetching detail pages concurrently")
+    scrape_parser.add_argument("--pipeline", action="store_true",
+                      help="Walk listing pages while detail pages are being fetched")
+    scrape_parser.add_argument("--queue-size", type=int, default=50,
+                      help="Maximum number of listings waiting for details with --pipeline")
+    scrape_parser.add_argument("--async", dest="use_async", action="store_true",
+                      help="Fetch listing and detail pages concurrently")
+    scrape_parser.add_argument("--concurrency", type=int, default=8,
+                      help="Maximum number of requests in flight with --async")
+    scrape_parser.add_argument("--per-host", type=int, default=4,
+                      help="Maximum number of requests in flight to one host with --async")
+    verbosity_group = scrape_parser.add_mutually_exclusive_group()
+    verbosity_group.add_argument("--quiet", action="store_true",
+                      help="Only log warnings and errors")
+    verbosity_group.add_argument("--verbose", action="store_true",
+                      help="Also log the fields found for every listing")
+    scrape_parser.add_argument("--log-json", action="store_true",
+                      help="Log one JSON object per line instead of text")
+    
+    # Running without a command scrapes, which needs the scrape options' defaults
+    parser.set_defaults(**vars(scrape_parser.parse_args([])))
     
     # Search command - simplified without AI options
     search_parser = subparsers.add_parser("search", help="Search job listings")
@@ -41,42 +103,156 @@ def setup_argparse() -> argparse.ArgumentParser:
     return parser
 
 
+def open_data_writer(path: str, file_format: str, fieldnames: List[str], pretty: bool = False) -> StreamWriter:
+    """Start writing the data file saved next to the CSV in one of FORMAT_NAMES."""
+    if file_format == "json":
+        return JsonStreamWriter(path, pretty=pretty)
+    if file_format == "parquet":
+        return ParquetStreamWriter(path, fieldnames)
+    return JsonLinesStreamWriter(path)
+
+
 def scrape_command(args, config):
     """Run the scraper."""
     print("=== Starting traineeship scraper ===")
     
+    # Progress goes to the log on stderr, the per-listing details only with --verbose
+    level = logging.WARNING if args.quiet else logging.DEBUG if args.verbose else logging.INFO
+    setup_logging(level, json_format=args.log_json)
+    
+    store = None
+    # Set once the crawl has finished and its results, if any, are saved
+    finished = False
     try:
         max_pages = args.max_pages if args.max_pages is not None else config["max_pages"]
         get_details = not args.no_details
         
-        scraper = ErasmusInternScraper(base_url=config["base_url"], data_dir=config["data_dir"])
-        traineeships = scraper.scrape_all(max_pages=max_pages, get_details=get_details)
+        if args.db:
+            store = TraineeshipStore(config["db_path"])
         
-        if not traineeships:
-            print("No traineeships found. Check connection or website structure.")
-            return
+        # In incremental mode, start from the most recent dataset and only scrape what's new
+        previous = []
+        known_urls = None
+        if args.incremental:
+            if store is not None:
+                # The database is looked up by URL instead of being loaded
+                if len(store):
+                    previous = known_urls = store
+                    print(f"Found {len(store)} known traineeships in {store.path}")
+            else:
+                previous_file = get_most_recent_data_file(config["data_dir"])
+                if previous_file:
+                    previous = load_traineeships(previous_file)
+                if previous:
+                    known_urls = {t.url for t in previous}
+                    print(f"Loaded {len(known_urls)} known traineeships from {previous_file}")
+            if known_urls is None:
+                print("No previous dataset found, scraping everything")
+        
+        scraper = ErasmusInternScraper(base_url=config["base_url"], data_dir=config["data_dir"],
+                                       cache_dir=None if args.no_cache else config["cache_dir"],
+                                       cache_size_mb=config["cache_size_mb"],
+                                       checkpoint_file=os.path.join(config["data_dir"], "scrape_checkpoint.jsonl"),
+                                       resume=args.resume,
+                                       rate_limit=config["rate_limit"],
+                                       rate_burst=config["rate_burst"],
+                                       max_rate_limit=config["max_rate_limit"],
+                                       max_retries=config["max_retries"],
+                                       error_budget=config["error_budget"],
+                                       breaker_threshold=config["breaker_threshold"],
+                                       breaker_cooldown=config["breaker_cooldown"],
+                                       parser=args.parser or config["html_parser"],
+                                       parse_workers=args.parse_workers,
+                                       stream_details=args.stream_details,
+                                       record_dir=args.record, replay_dir=args.replay)
+        # Traineeships are written as they are scraped, the files get their
+        # final names once the crawl is complete
+        date_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        csv_file = args.output or os.path.join(config["data_dir"], f"erasmusintern_traineeships_{date_str}.csv")
+        data_file = os.path.join(config["data_dir"], f"erasmusintern_traineeships_{date_str}.{args.format}")
+        fieldnames = LISTING_FIELDS + (DETAIL_FIELDS if get_details else [])
+        if previous:
+            fieldnames += [key for key in next(iter(previous)).to_dict() if key not in fieldnames]
         
-        # Clean up null values
-        for t in traineeships:
-            for key, value in t.items():
-                if value is None:
-                    t[key] = "Not specified"
+        with CsvStreamWriter(csv_file, fieldnames) as csv_writer, \
+                open_data_writer(data_file, args.format, fieldnames, args.pretty) as data_writer:
+            def save(traineeship):
+                with scraper.metrics.timed("save"):
+                    record = traineeship.to_dict()
+                    # Clean up null values
+                    for key, value in record.items():
+                        if value is None:
+                            record[key] = "Not specified"
+                    csv_writer.write(record)
+                    data_writer.write(record)
+            
+            new_urls = set()
+            try:
+                if args.use_async:
+                    traineeships = asyncio.run(scraper.scrape_all_async(
+                        max_pages=max_pages, get_details=get_details,
+                        concurrency=args.concurrency, per_host=args.per_host,
+                        known_urls=known_urls))
+                else:
+                    traineeships = scraper.iter_traineeships(max_pages=max_pages, get_details=get_details,
+                                                             detail_workers=args.detail_workers,
+                                                             pipeline=args.pipeline, queue_size=args.queue_size,
+                                                             known_urls=known_urls)
+                for traineeship in traineeships:
+                    save(traineeship)
+                    if known_urls is not None:
+                        new_urls.add(traineeship.url)
+                    if store is not None:
+                        with scraper.metrics.timed("save"):
+                            store.save(traineeship)
+            finally:
+                scraper.close()
+                if store is not None:
+                    store.commit()
+            
+            if known_urls is not None:
+                if not new_urls:
+                    csv_writer.discard()
+                    data_writer.discard()
+                    print("No new traineeships since the previous dataset.")
+                    finished = True
+                    return
+                print(f"Found {len(new_urls)} new traineeships")
+                # Newest listings first, followed by everything from the previous dataset
+                for traineeship in previous:
+                    if traineeship.url not in new_urls:
+                        save(traineeship)
+            
+            if not csv_writer.count:
+                csv_writer.discard()
+                data_writer.discard()
+                print("No traineeships found. Check connection or website structure.")
+                finished = True
+                return
         
-        # Save data
-        output_file = scraper.save_to_csv(traineeships, args.output)
-        if output_file:
-            print(f"Data saved to {output_file}")
-        else:
-            print("Failed to save data.")
+        finished = True
+        print(f"Data saved to {csv_file}")
+        print(f"Data also saved as {FORMAT_NAMES[args.format]} to {data_file}")
+        if store is not None:
+            print(f"Database {store.path} now holds {len(store)} traineeships")
         
-        # Also save as JSON for better compatibility with other tools
-        json_file = scraper.save_to_json(traineeships)
-        if json_file:
-            print(f"Data also saved as JSON to {json_file}")
+        print(scraper.metrics.report())
     
+    except CrawlAborted as e:
+        print(f"Scraping aborted: {str(e)}")
+        print("Progress has been saved. Run the same command with --resume to continue.")
+        if args.format.startswith("jsonl"):
+            print(f"Traineeships scraped so far are in {data_file}")
+        print(scraper.metrics.report())
     except Exception as e:
         print(f"Error during scraping: {str(e)}")
         traceback.print_exc()
+    finally:
+        if store is not None:
+            store.close()
+        # The results are safe on disk, so the next crawl starts from scratch
+        if finished:
+            scraper.checkpoint.clear()
 
 
 def search_command(args, config):
@@ -1,25 +1,63 @@
-import json
 import csv
 import argparse
 import os
-from datetime import datetime
+from datetime import date, datetime
 import pandas as pd
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
-def load_data(file_path):
-    """Load job data from JSON or CSV file."""
-    if file_path.endswith('.json'):
+from src import jsonio
+from src.db import TraineeshipStore
+from src.jsonl import is_jsonl, iter_jsonl
+from src.parquet import import_pyarrow, read_parquet
+from src.records import INTERNED_FIELDS, Traineeship
+
+# Fields the ranking uses: the ones it embeds and the URL identifying each job.
+# Only these columns are read from Parquet files
+RANK_COLUMNS = ['title', 'company', 'field', 'description', 'url']
+
+def load_data(file_path, country=None, field=None, open_only=False, columns=None):
+    """
+    Load job data from JSON, JSON Lines, CSV or Parquet file as Traineeship records.
+    
+    From a SQLite database written by `main.py scrape --db`, only the jobs
+    matching the filters are loaded, using the database's indexes. From a
+    Parquet file, only the given columns are read (None for all).
+    """
+    if file_path.endswith('.db'):
+        if not os.path.exists(file_path):
+            print(f"Database not found: {file_path}")
+            return []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with TraineeshipStore(file_path) as store:
+                return list(store.query(country=country, field=field,
+                                        deadline_after=date.today() if open_only else None))
+        except Exception as e:
+            print(f"Error loading database: {e}")
+            return []
+    elif file_path.endswith('.json'):
+        try:
+            return [Traineeship.from_dict(job) for job in jsonio.load(file_path)]
         except Exception as e:
             print(f"Error loading JSON file: {e}")
             return []
+    elif file_path.endswith('.parquet'):
+        try:
+            return read_parquet(file_path, columns=columns)
+        except Exception as e:
+            print(f"Error loading Parquet file: {e}")
+            return []
+    elif is_jsonl(file_path):
+        # Read one line at a time instead of parsing the whole file at once
+        try:
+            return [Traineeship.from_dict(job) for job in iter_jsonl(file_path)]
+        except Exception as e:
+            print(f"Error loading JSON Lines file: {e}")
+            return []
     elif file_path.endswith('.csv'):
         try:
-            return pd.read_csv(file_path).to_dict('records')
+            return [Traineeship.from_dict(job) for job in pd.read_csv(file_path).to_dict('records')]
         except Exception as e:
             print(f"Error loading CSV file: {e}")
             return []
@@ -56,21 +94,38 @@ def calculate_match_probabilities(model, job_texts, query):
     
     return similarities
 
-def save_to_csv(jobs, match_probabilities, query, output_file=None):
+def jobs_frame(jobs, columns=None):
+    """Create a DataFrame of jobs, with only the given columns if they were the only ones loaded."""
+    df = pd.DataFrame([job.to_dict() for job in jobs])
+    if columns:
+        df = df[[col for col in columns if col in df.columns]]
+    return df
+
+def write_rankings(df, output_file):
+    """Write ranked jobs to CSV, or to Parquet if the file name ends in .parquet."""
+    if output_file.endswith('.parquet'):
+        # Dictionary-encode the repetitive columns, like the scraper's Parquet files
+        df = df.astype({col: 'category' for col in INTERNED_FIELDS if col in df.columns})
+        df.to_parquet(output_file, index=False, compression='zstd')
+    else:
+        df.to_csv(output_file, index=False)
+
+def save_to_csv(jobs, match_probabilities, query, output_file=None, columns=None):
     """
     Save jobs with match probabilities to CSV file.
     
     Args:
-        jobs: List of job dictionaries
+        jobs: List of Traineeship records
         match_probabilities: List of match probabilities
         query: The search query used
         output_file: Output file path (optional)
+        columns: Columns loaded from the input file, if not all of them
     
     Returns:
         Path to the saved CSV file
     """
     # Create a DataFrame
-    df = pd.DataFrame(jobs)
+    df = jobs_frame(jobs, columns)
     
     # Add match probability column
     df[f'match_probability_{query.replace(" ", "_")}'] = match_probabilities
@@ -88,17 +143,23 @@ def save_to_csv(jobs, match_probabilities, query, output_file=None):
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     
     # Save to CSV
-    df.to_csv(output_file, index=False)
+    write_rankings(df, output_file)
     
     return output_file
 
-def process_query(query, input_file, output_file=None, model_name='all-MiniLM-L6-v2'):
+def save_scores_to_db(db_path, query, jobs, match_probabilities):
+    """Store the match probabilities for a query next to the jobs in the database."""
+    with TraineeshipStore(db_path) as store:
+        store.save_scores(query, {job.url: p for job, p in zip(jobs, match_probabilities)})
+
+def process_query(query, input_file, output_file=None, model_name='all-MiniLM-L6-v2', filters=None):
     """
     Process a search query and rank all jobs by match probability.
     
     Args:
         query: Search query
-        input_file: Path to input file (JSON or CSV)
+        input_file: Path to input file (JSON, JSON Lines, CSV, Parquet or a database).
+            From Parquet only RANK_COLUMNS are read, and the rankings only contain them
         output_file: Path to output CSV file (optional)
         model_name: Name of the sentence transformer model to use
     
@@ -106,7 +167,8 @@ def process_query(query, input_file, output_file=None, model_name='all-MiniLM-L6
         Path to the saved CSV file
     """
     # Load job data
-    jobs = load_data(input_file)
+    columns = RANK_COLUMNS if input_file.endswith('.parquet') else None
+    jobs = load_data(input_file, columns=columns, **(filters or {}))
     if not jobs:
         print(f"No jobs loaded from {input_file}")
         return None
@@ -123,9 +185,11 @@ def process_query(query, input_file, output_file=None, model_name='all-MiniLM-L6
         
         # Calculate match probabilities
         match_probabilities = calculate_match_probabilities(model, job_texts, query)
+        if input_file.endswith('.db'):
+            save_scores_to_db(input_file, query, jobs, match_probabilities)
         
         # Save results to CSV
-        output_path = save_to_csv(jobs, match_probabilities, query, output_file)
+        output_path = save_to_csv(jobs, match_probabilities, query, output_file, columns)
         
         print(f"Job rankings saved to {output_path}")
         return output_path
@@ -135,20 +199,22 @@ def process_query(query, input_file, output_file=None, model_name='all-MiniLM-L6
         print("To install: pip install sentence-transformers")
         return None
 
-def process_multiple_queries(queries, input_file, output_file=None):
+def process_multiple_queries(queries, input_file, output_file=None, filters=None):
     """
     Process multiple search queries and combine the results.
     
     Args:
         queries: List of search queries
-        input_file: Path to input file (JSON or CSV)
+        input_file: Path to input file (JSON, JSON Lines, CSV, Parquet or a database).
+            From Parquet only RANK_COLUMNS are read, and the rankings only contain them
         output_file: Path to output CSV file (optional)
     
     Returns:
         Path to the saved CSV file
     """
     # Load job data
-    jobs = load_data(input_file)
+    columns = RANK_COLUMNS if input_file.endswith('.parquet') else None
+    jobs = load_data(input_file, columns=columns, **(filters or {}))
     if not jobs:
         print(f"No jobs loaded from {input_file}")
         return None
@@ -164,13 +230,15 @@ def process_multiple_queries(queries, input_file, output_file=None):
         job_texts = create_job_texts(jobs)
         
         # Create DataFrame
-        df = pd.DataFrame(jobs)
+        df = jobs_frame(jobs, columns)
         
         # Process each query and add as a column
         for query in queries:
             print(f"Processing query: '{query}'")
             match_probabilities = calculate_match_probabilities(model, job_texts, query)
             df[f'match_probability_{query.replace(" ", "_")}'] = match_probabilities
+            if input_file.endswith('.db'):
+                save_scores_to_db(input_file, query, jobs, match_probabilities)
         
         # Add an average match probability column
         probability_cols = [col for col in df.columns if col.startswith('match_probability_')]
@@ -188,7 +256,7 @@ def process_multiple_queries(queries, input_file, output_file=None):
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
         # Save to CSV
-        df.to_csv(output_file, index=False)
+        write_rankings(df, output_file)
         
         print(f"Job rankings saved to {output_file}")
         return output_file
@@ -202,21 +270,35 @@ def main():
     parser = argparse.ArgumentParser(description='Rank jobs by match probability for a search query')
     parser.add_argument('query', nargs='*', help='Search query or queries (e.g., "AI engineering" "full stack development")')
     parser.add_argument('--file', '-f', default='data/erasmusintern_traineeships_2025-02-27_18-28-26.json', 
-                        help='Path to input file with job data (JSON or CSV)')
-    parser.add_argument('--output', '-o', help='Path to output CSV file')
+                        help='Path to input file with job data (JSON, JSON Lines, CSV, Parquet or a SQLite database from main.py scrape --db)')
+    parser.add_argument('--output', '-o', help='Path to output CSV file (or Parquet file, ending in .parquet)')
     parser.add_argument('--model', '-m', default='all-MiniLM-L6-v2', 
                         help='Name of the sentence transformer model to use')
+    parser.add_argument('--country', help='Only rank jobs in this country (database input only)')
+    parser.add_argument('--field', help='Only rank jobs in this field of study (database input only)')
+    parser.add_argument('--open-only', action='store_true',
+                        help='Only rank jobs whose deadline has not passed (database input only)')
     args = parser.parse_args()
     
     if not args.query:
         parser.error("At least one search query is required")
     
+    if args.output and args.output.endswith('.parquet'):
+        try:
+            import_pyarrow()
+        except ImportError as e:
+            parser.error(str(e))
+    
+    filters = {'country': args.country, 'field': args.field, 'open_only': args.open_only}
+    if any(filters.values()) and not args.file.endswith('.db'):
+        parser.error("--country, --field and --open-only need a database as --file")
+    
     if len(args.query) == 1:
         # Process a single query
-        process_query(args.query[0], args.file, args.output, args.model)
+        process_query(args.query[0], args.file, args.output, args.model, filters)
     else:
         # Process multiple queries
-        process_multiple_queries(args.query, args.file, args.output)
+        process_multiple_queries(args.query, args.file, args.output, filters)
 
 if __name__ == "__main__":
     main()
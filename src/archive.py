@@ -0,0 +1,74 @@
+import os
+import gzip
+import json
+from typing import Optional
+
+import requests
+
+from src.utils import url_file_name, write_file_atomic
+
+
+class ArchiveMiss(requests.RequestException):
+    """Raised when a replayed crawl asks for a page that wasn't recorded."""
+
+
+class ResponseArchive:
+    """
+    A directory of recorded pages, so a crawl can be replayed without any network.
+
+    Every page is stored as a gzip-compressed JSON file named after its URL,
+    next to a manifest with the URL of the crawl's first listing page.
+    """
+
+    MANIFEST = "archive.json"
+
+    def __init__(self, path: str, base_url: Optional[str] = None, replay: bool = False):
+        """
+        Open an archive.
+
+        Args:
+            path: Directory of the archive
+            base_url: URL of the first listing page of the crawl being recorded
+            replay: Whether to serve the pages of an existing archive instead of
+                recording new ones. The base URL is then read from the archive
+
+        Raises:
+            FileNotFoundError: If the archive to replay doesn't exist
+        """
+        self.path = path
+        self.replay = replay
+        manifest = os.path.join(path, self.MANIFEST)
+
+        if replay:
+            with open(manifest, 'r', encoding='utf-8') as f:
+                self.base_url = json.load(f)["base_url"]
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.base_url = base_url
+            with open(manifest, 'w', encoding='utf-8') as f:
+                json.dump({"base_url": base_url}, f, indent=4)
+
+    def _file(self, url: str) -> str:
+        """Get the path of the file a URL is stored in."""
+        return os.path.join(self.path, url_file_name(url, '.json.gz'))
+
+    def save(self, url: str, html: str) -> None:
+        """Add a page to the archive, replacing any earlier recording of it."""
+        data = json.dumps({"url": url, "body": html}, ensure_ascii=False).encode('utf-8')
+        write_file_atomic(self._file(url), gzip.compress(data))
+
+    def load(self, url: str) -> str:
+        """
+        Get the HTML recorded for a URL.
+
+        Raises:
+            ArchiveMiss: If the URL wasn't recorded
+        """
+        try:
+            with gzip.open(self._file(url), 'rb') as f:
+                entry = json.loads(f.read().decode('utf-8'))
+        except FileNotFoundError:
+            raise ArchiveMiss(f"{url} is not in the archive {self.path}")
+        if entry.get("url") != url:
+            raise ArchiveMiss(f"{url} is not in the archive {self.path}")
+        return entry["body"]
@@ -0,0 +1,102 @@
+import os
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+from src import jsonio
+from src.records import Traineeship
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCheckpoint:
+    """
+    An append-only journal of a crawl's progress.
+
+    Every scraped listing page and every fetched detail page is written to the
+    journal as soon as it is done, so a crawl that crashes or is killed can be
+    resumed without repeating those requests.
+
+    Only the progress read from an existing journal is kept in memory, and
+    each entry is dropped once it has been handed back, so memory use doesn't
+    grow with the size of the crawl.
+    """
+
+    def __init__(self, path: str, base_url: str, resume: bool = False):
+        """
+        Open the journal for a crawl.
+
+        Args:
+            path: Path to the journal file
+            base_url: URL of the first listing page of the crawl
+            resume: Whether to continue from an existing journal for the same
+                base URL instead of starting a new one
+        """
+        self.path = path
+        self.base_url = base_url
+        self._lock = threading.Lock()
+        self._pages: Dict[int, List[Traineeship]] = {}
+        self._details: Dict[str, Traineeship] = {}
+
+        if resume and os.path.exists(path):
+            self._load()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if self._pages or self._details:
+            self._file = open(path, 'a', encoding='utf-8')
+            logger.info("Resuming crawl: %d pages and %d details already done", len(self._pages), len(self._details))
+        else:
+            self._file = open(path, 'w', encoding='utf-8')
+            self._write({"type": "crawl", "base_url": base_url})
+
+    def _load(self) -> None:
+        """Read the progress recorded in an existing journal."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = jsonio.loads(line)
+                except ValueError:
+                    # The last line may be cut short if the crawl was killed mid-write
+                    continue
+
+                if entry.get("type") == "crawl" and entry.get("base_url") != self.base_url:
+                    logger.warning("Checkpoint %s is for %s, starting a new crawl", self.path, entry.get('base_url'))
+                    self._pages.clear()
+                    self._details.clear()
+                    return
+                if entry.get("type") == "page":
+                    self._pages[entry["page"]] = [Traineeship.from_dict(t) for t in entry["traineeships"]]
+                elif entry.get("type") == "detail":
+                    self._details[entry["url"]] = Traineeship.from_dict(entry["traineeship"])
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """Append an entry to the journal and flush it to disk."""
+        line = jsonio.dumps(entry)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def get_page(self, page_num: int) -> Optional[List[Traineeship]]:
+        """Take the listings of a page scraped by an earlier run, or None if the page isn't done."""
+        with self._lock:
+            return self._pages.pop(page_num, None)
+
+    def add_page(self, page_num: int, traineeships: List[Traineeship]) -> None:
+        """Record the listings scraped from a page."""
+        self._write({"type": "page", "page": page_num, "traineeships": [t.to_dict() for t in traineeships]})
+
+    def get_details(self, url: str) -> Optional[Traineeship]:
+        """Take a traineeship whose details were fetched by an earlier run, or None if they weren't."""
+        with self._lock:
+            return self._details.pop(url, None)
+
+    def add_details(self, url: str, traineeship: Traineeship) -> None:
+        """Record a traineeship with its details."""
+        self._write({"type": "detail", "url": url, "traineeship": traineeship.to_dict()})
+
+    def clear(self) -> None:
+        """Close and remove the journal once the crawl's results are saved."""
+        with self._lock:
+            self._file.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,253 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.records import FIELD_NAMES, Traineeship
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS traineeships (
+    url TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    country TEXT,
+    duration TEXT,
+    post_date TEXT,
+    deadline TEXT,
+    field TEXT,
+    page_number INTEGER,
+    description TEXT,
+    extra TEXT,
+    post_date_iso TEXT,
+    deadline_iso TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS traineeships_deadline ON traineeships (deadline_iso);
+CREATE INDEX IF NOT EXISTS traineeships_post_date ON traineeships (post_date_iso);
+CREATE INDEX IF NOT EXISTS traineeships_country ON traineeships (country);
+
+-- The field of a traineeship lists several fields of study, one row per field
+CREATE TABLE IF NOT EXISTS traineeship_fields (
+    field TEXT NOT NULL,
+    url TEXT NOT NULL REFERENCES traineeships (url) ON DELETE CASCADE,
+    PRIMARY KEY (field, url)
+);
+CREATE INDEX IF NOT EXISTS traineeship_fields_url ON traineeship_fields (url);
+
+CREATE TABLE IF NOT EXISTS match_scores (
+    url TEXT NOT NULL REFERENCES traineeships (url) ON DELETE CASCADE,
+    query TEXT NOT NULL,
+    probability REAL NOT NULL,
+    ranked_at TEXT NOT NULL,
+    PRIMARY KEY (query, url)
+);
+"""
+
+COLUMNS = FIELD_NAMES + ["extra", "country", "post_date_iso", "deadline_iso"]
+
+# A traineeship scraped again replaces the stored one, except that a
+# description isn't lost when the new crawl didn't fetch detail pages
+UPSERT = f"""
+INSERT INTO traineeships ({", ".join(COLUMNS)}, first_seen, last_seen)
+VALUES ({", ".join("?" for _ in COLUMNS)}, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    {", ".join(f"{c} = excluded.{c}" for c in COLUMNS if c not in ("url", "description"))},
+    description = COALESCE(excluded.description, traineeships.description),
+    last_seen = excluded.last_seen
+"""
+
+
+def parse_date(text: Optional[str]) -> Optional[str]:
+    """Convert a date as shown on the site ("28 Feb, 2025") to ISO format, or None if it isn't one."""
+    if not text:
+        return None
+    try:
+        return datetime.strptime(text.strip(), "%d %b, %Y").date().isoformat()
+    except ValueError:
+        return None
+
+
+class TraineeshipStore:
+    """
+    A SQLite database of traineeships, one row per URL.
+
+    Saving a traineeship that is already stored updates it, so repeated
+    crawls keep one database up to date instead of writing a new dataset
+    each time. Every row records when the traineeship was first and last
+    scraped. Traineeships can be looked up by URL and queried by deadline,
+    post date, country and field of study through indexes, and the match
+    probabilities computed by rank_jobs.py are stored next to them.
+
+    The store can be shared between threads.
+    """
+
+    # Number of traineeships saved between commits
+    batch_size = 100
+
+    def __init__(self, path: str):
+        """
+        Open the database, creating it if it doesn't exist.
+
+        Args:
+            path: Path of the database file
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(SCHEMA)
+
+    def save(self, traineeship: Traineeship, seen: Optional[str] = None) -> None:
+        """
+        Insert a traineeship or update the stored one with the same URL.
+
+        Changes are committed in batches; call commit() or close() when done.
+
+        Args:
+            traineeship: The traineeship to save
+            seen: When it was scraped, as an ISO timestamp (default: now)
+        """
+        seen = seen or datetime.now().isoformat(timespec="seconds")
+        values = [getattr(traineeship, name) for name in FIELD_NAMES] + [
+            json.dumps(traineeship.extra, ensure_ascii=False) if traineeship.extra else None,
+            traineeship.country,
+            parse_date(traineeship.post_date),
+            parse_date(traineeship.deadline),
+        ]
+        fields = [f.strip() for f in (traineeship.field or "").split(",") if f.strip()]
+        with self._lock:
+            self._db.execute(UPSERT, values + [seen, seen])
+            self._db.execute("DELETE FROM traineeship_fields WHERE url = ?", (traineeship.url,))
+            self._db.executemany("INSERT OR IGNORE INTO traineeship_fields (field, url) VALUES (?, ?)",
+                                 [(f, traineeship.url) for f in fields])
+            self._pending += 1
+            if self._pending >= self.batch_size:
+                self._db.commit()
+                self._pending = 0
+
+    def save_many(self, traineeships: Iterable[Traineeship]) -> int:
+        """Save several traineeships and commit them, returning how many were saved."""
+        seen = datetime.now().isoformat(timespec="seconds")
+        count = 0
+        for traineeship in traineeships:
+            self.save(traineeship, seen)
+            count += 1
+        self.commit()
+        return count
+
+    def commit(self) -> None:
+        """Write the saved traineeships to disk."""
+        with self._lock:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        self.commit()
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "TraineeshipStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM traineeships").fetchone()[0]
+
+    def __contains__(self, url: object) -> bool:
+        """Whether a traineeship with the URL is stored, so the store can be passed as known_urls."""
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM traineeships WHERE url = ?", (url,)).fetchone() is not None
+
+    def get(self, url: str) -> Optional[Traineeship]:
+        """Get the traineeship with the URL, or None if it isn't stored."""
+        found = self._select("WHERE url = ?", [url])
+        return found[0] if found else None
+
+    def __iter__(self) -> Iterator[Traineeship]:
+        """Iterate over all traineeships, most recently found first and in listing order within a crawl."""
+        return self.query()
+
+    def query(self, country: Optional[str] = None, field: Optional[str] = None,
+              deadline_after: Optional[date] = None, posted_after: Optional[date] = None,
+              limit: Optional[int] = None) -> Iterator[Traineeship]:
+        """
+        Iterate over the traineeships matching all of the given conditions.
+
+        Args:
+            country: Country of the traineeship
+            field: One of the fields of study of the traineeship
+            deadline_after: Earliest deadline (inclusive). Traineeships without a
+                deadline are left out
+            posted_after: Earliest post date (inclusive)
+            limit: Maximum number of traineeships
+
+        Yields:
+            Matching traineeships, most recently found first
+        """
+        conditions = []
+        params: List[Any] = []
+        if country is not None:
+            conditions.append("country = ?")
+            params.append(country)
+        if field is not None:
+            conditions.append("url IN (SELECT url FROM traineeship_fields WHERE field = ?)")
+            params.append(field)
+        if deadline_after is not None:
+            conditions.append("deadline_iso >= ?")
+            params.append(deadline_after.isoformat())
+        if posted_after is not None:
+            conditions.append("post_date_iso >= ?")
+            params.append(posted_after.isoformat())
+
+        sql = ("WHERE " + " AND ".join(conditions) if conditions else "") + " ORDER BY first_seen DESC, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        # Rows are fetched in chunks, without holding the lock in between
+        with self._lock:
+            cursor = self._db.execute(f"SELECT {', '.join(FIELD_NAMES)}, extra FROM traineeships {sql}", params)
+            rows = cursor.fetchmany(500)
+        while rows:
+            for row in rows:
+                yield self._record(row)
+            with self._lock:
+                rows = cursor.fetchmany(500)
+
+    def _select(self, sql: str, params: List[Any]) -> List[Traineeship]:
+        with self._lock:
+            rows = self._db.execute(f"SELECT {', '.join(FIELD_NAMES)}, extra FROM traineeships {sql}",
+                                    params).fetchall()
+        return [self._record(row) for row in rows]
+
+    @staticmethod
+    def _record(row: tuple) -> Traineeship:
+        *values, extra = row
+        return Traineeship(*values, extra=json.loads(extra) if extra else None)
+
+    def save_scores(self, query: str, scores: Dict[str, float]) -> None:
+        """
+        Store the match probability of traineeships for a search query.
+
+        Args:
+            query: The search query
+            scores: Match probability by traineeship URL
+        """
+        ranked_at = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._db.executemany(
+                "INSERT INTO match_scores (url, query, probability, ranked_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (query, url) DO UPDATE SET probability = excluded.probability, "
+                "ranked_at = excluded.ranked_at",
+                [(url, query, float(p), ranked_at) for url, p in scores.items()])
+            self._db.commit()
@@ -0,0 +1,199 @@
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from src.parsers import LexborNode
+
+
+# A compound selector such as "h3.dot-title": an optional tag name and a set of classes
+Step = Tuple[Optional[str], FrozenSet[str]]
+
+
+def compile_selector(selector: str) -> List[List[Step]]:
+    """
+    Compile a CSS selector group into chains of compound selectors.
+
+    Only tag and class selectors joined by descendant combinators are
+    supported, which covers every selector the listing extractor uses.
+
+    Args:
+        selector: A selector such as ".field-name-title a, h3.dot-title a"
+
+    Returns:
+        One chain of steps per comma-separated selector
+    """
+    chains = []
+    for part in selector.split(','):
+        steps = []
+        for compound in part.split():
+            if any(c in compound for c in '>+~[]:#*'):
+                raise ValueError(f"Unsupported selector '{part.strip()}'")
+            tag, *classes = compound.split('.')
+            steps.append((tag or None, frozenset(classes)))
+        if not steps:
+            raise ValueError(f"Empty selector in '{selector}'")
+        chains.append(steps)
+    return chains
+
+
+class ExtractionPlan:
+    """
+    A set of selectors compiled so that a single walk over an element's subtree
+    finds the first match of every selector.
+
+    Instead of running one full subtree match per select_one call, the walk
+    keeps track of how far each selector chain has been matched by the current
+    element's ancestors and only looks at the chains whose next step mentions
+    one of the element's classes or its tag. The result is the same as
+    calling select_one for each selector on the element.
+
+    selectolax trees are matched with lexbor's own (compiled) selector engine
+    instead, which is faster than any walk in Python.
+    """
+
+    def __init__(self, selectors: List[str], scoped: Optional[Dict[str, List[str]]] = None):
+        """
+        Compile the selectors.
+
+        Args:
+            selectors: Selectors to find the first match of
+            scoped: Selectors that are matched inside the first match of another
+                selector, keyed by that selector (which must be in `selectors`).
+                This is the same as container.select_one(scope).select_one(selector)
+        """
+        scoped = scoped or {}
+        for scope in scoped:
+            if scope not in selectors:
+                raise ValueError(f"Scope '{scope}' is not one of the selectors")
+
+        # Every chain is stored with the key it reports its match under and the
+        # scope it has to be inside of
+        self._chains: List[Tuple[Any, int, Optional[str]]] = []
+        self._selectors = list(selectors)
+        self._scoped = scoped
+        self._keys = set()
+        self._scopes = set(scoped)
+        self._by_class: Dict[str, List[Tuple[int, int, Step]]] = {}
+        self._by_tag: Dict[str, List[Tuple[int, int, Step]]] = {}
+
+        entries = [(selector, selector, None) for selector in selectors]
+        entries += [((scope, selector), selector, scope) for scope, subs in scoped.items() for selector in subs]
+        for key, selector, scope in entries:
+            self._keys.add(key)
+            for steps in compile_selector(selector):
+                chain_id = len(self._chains)
+                self._chains.append((key, len(steps), scope))
+                for position, step in enumerate(steps):
+                    tag, classes = step
+                    # Dispatch on one class of the step, or on its tag if it has no class
+                    if classes:
+                        self._by_class.setdefault(min(classes), []).append((chain_id, position, step))
+                    else:
+                        self._by_tag.setdefault(tag, []).append((chain_id, position, step))
+
+    def _advance(self, element: Any, progress: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        Match an element against the chains.
+
+        Args:
+            element: The element
+            progress: Number of steps of each chain matched by the element's ancestors
+
+        Returns:
+            The progress for the element's children (the same list if unchanged)
+            and the ids of the chains the element completes
+        """
+        name = element.name
+        classes = element.get('class') or ()
+
+        candidates = []
+        for class_name in classes:
+            candidates += self._by_class.get(class_name, ())
+        candidates += self._by_tag.get(name, ())
+
+        # Check against the ancestors' progress, an element can't be its own ancestor
+        advanced = progress
+        matched = []
+        for chain_id, position, (tag, step_classes) in candidates:
+            if progress[chain_id] != position:
+                continue
+            if tag is not None and tag != name:
+                continue
+            if not step_classes.issubset(classes):
+                continue
+            if position == self._chains[chain_id][1] - 1:
+                matched.append(chain_id)
+            else:
+                if advanced is progress:
+                    advanced = progress.copy()
+                advanced[chain_id] = position + 1
+        return advanced, matched
+
+    def first_matches(self, root: Any) -> Dict[Any, Any]:
+        """
+        Find the first descendant of an element matching each selector.
+
+        Args:
+            root: A BeautifulSoup Tag or a LexborNode
+
+        Returns:
+            The first match of each selector that matched, keyed by selector
+            (and by (scope, selector) for scoped selectors)
+        """
+        if isinstance(root, LexborNode):
+            return self._select_each(root)
+
+        # Ancestors of the root (and the root itself) can satisfy the first
+        # steps of a chain, exactly like they do for select_one
+        ancestors = []
+        node = root
+        while node is not None and node.name is not None:
+            ancestors.append(node)
+            node = node.parent
+        progress = [0] * len(self._chains)
+        for node in reversed(ancestors):
+            progress, _ = self._advance(node, progress)
+
+        found: Dict[Any, Any] = {}
+        stack = [(child, progress, frozenset()) for child in reversed(list(_element_children(root)))]
+        while stack:
+            element, progress, scopes = stack.pop()
+            child_progress, matched = self._advance(element, progress)
+
+            child_scopes = scopes
+            for chain_id in matched:
+                key, _, scope = self._chains[chain_id]
+                if key in found or (scope is not None and scope not in scopes):
+                    continue
+                found[key] = element
+                if key in self._scopes:
+                    child_scopes = child_scopes | {key}
+
+            if len(found) == len(self._keys):
+                break
+            for child in reversed(list(_element_children(element))):
+                stack.append((child, child_progress, child_scopes))
+
+        return found
+
+    def _select_each(self, root: Any) -> Dict[Any, Any]:
+        """Find the first match of each selector with one select_one call per selector."""
+        found: Dict[Any, Any] = {}
+        for selector in self._selectors:
+            elem = root.select_one(selector)
+            if elem is not None:
+                found[selector] = elem
+        for scope, selectors in self._scoped.items():
+            scope_elem = found.get(scope)
+            if scope_elem is None:
+                continue
+            for selector in selectors:
+                elem = scope_elem.select_one(selector)
+                if elem is not None:
+                    found[(scope, selector)] = elem
+        return found
+
+
+def _element_children(element: Any):
+    """Yield the child elements of a BeautifulSoup Tag or LexborNode, skipping text and comments."""
+    for child in element.children:
+        if child.name is not None:
+            yield child
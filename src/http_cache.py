@@ -0,0 +1,137 @@
+import os
+import json
+import time
+import threading
+from typing import Dict, Any, Optional
+
+import requests
+
+from src.utils import url_file_name, write_file_atomic
+
+
+class ResponseCache:
+    """
+    An on-disk cache of response bodies and their validators, keyed by URL.
+
+    Entries are only stored for responses that carry an ETag or Last-Modified
+    header, so every cached body can be revalidated with a conditional request.
+    When the cache grows beyond its size limit, the least recently used entries
+    are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 200 * 1024 * 1024):
+        """Initialize the cache in the given directory with a size limit in bytes."""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Size and last use of every entry, used for eviction
+        self._entries: Dict[str, Dict[str, float]] = {}
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and entry.name.endswith('.json'):
+                stat = entry.stat()
+                self._entries[entry.name] = {"size": stat.st_size, "used": stat.st_mtime}
+        self._total_bytes = sum(e["size"] for e in self._entries.values())
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Get the cache file name for a URL."""
+        return url_file_name(url, '.json')
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached entry for a URL.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            Dictionary with the body and its validators, or None if the URL isn't cached
+        """
+        key = self._key(url)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            try:
+                with open(os.path.join(self.cache_dir, key), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+        return entry if entry.get("url") == url else None
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Get the request headers that revalidate a cached entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def touch(self, url: str) -> None:
+        """Mark a cached entry as recently used."""
+        key = self._key(url)
+        with self._lock:
+            if key in self._entries:
+                try:
+                    os.utime(os.path.join(self.cache_dir, key))
+                except OSError:
+                    pass
+                self._entries[key]["used"] = time.time()
+
+    def store(self, url: str, response: requests.Response) -> bool:
+        """
+        Store a response body together with its validators.
+
+        Args:
+            url: URL of the page
+            response: The successful response
+
+        Returns:
+            True if the response was cached, False if it has no validators
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        data = json.dumps({
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": response.text,
+        }, ensure_ascii=False).encode('utf-8')
+
+        key = self._key(url)
+        with self._lock:
+            write_file_atomic(os.path.join(self.cache_dir, key), data)
+
+            if key in self._entries:
+                self._total_bytes -= self._entries[key]["size"]
+            self._entries[key] = {"size": len(data), "used": time.time()}
+            self._total_bytes += len(data)
+            self._evict()
+        return True
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry from disk and from the index (caller holds the lock)."""
+        try:
+            os.remove(os.path.join(self.cache_dir, key))
+        except OSError:
+            pass
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._total_bytes -= entry["size"]
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size limit (caller holds the lock)."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        for key in sorted(self._entries, key=lambda k: self._entries[k]["used"]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
@@ -0,0 +1,84 @@
+import json
+from typing import Any, Callable, Dict, Tuple, Union
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Compact encoder (to UTF-8 bytes) and decoder of each available JSON library.
+# They all write the same text for the records the scraper produces: without
+# escaping non-ASCII characters and without spaces.
+BACKENDS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[Union[str, bytes]], Any]]] = {
+    "json": (_json_dumpb, json.loads),
+}
+# Errors the libraries raise for invalid JSON
+_DECODE_ERRORS: Tuple[type, ...] = (ValueError,)
+
+try:
+    import orjson
+    BACKENDS["orjson"] = (orjson.dumps, orjson.loads)
+except ImportError:
+    pass
+
+try:
+    import msgspec
+    BACKENDS["msgspec"] = (msgspec.json.encode, msgspec.json.decode)
+    _DECODE_ERRORS += (msgspec.DecodeError,)
+except ImportError:
+    pass
+
+# The fastest library installed, falling back to the standard library
+BACKEND = next(name for name in ("orjson", "msgspec", "json") if name in BACKENDS)
+_dumpb, _loads = BACKENDS[BACKEND]
+
+
+def dumpb(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode a value as JSON in UTF-8.
+
+    Args:
+        obj: The value
+        pretty: Indent by four spaces, like the files written by earlier
+            versions, instead of writing compact JSON. Pretty output always
+            uses the standard library
+
+    Returns:
+        The encoded JSON
+    """
+    if pretty:
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+    try:
+        return _dumpb(obj)
+    except TypeError:
+        # Types the fast libraries don't support
+        return _json_dumpb(obj)
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Encode a value as JSON text, see dumpb."""
+    return dumpb(obj, pretty).decode("utf-8")
+
+
+def dump(obj: Any, path: str, pretty: bool = False) -> None:
+    """Encode a value as JSON and write it to a file, without a round trip through str."""
+    data = dumpb(obj, pretty)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text, raising ValueError if it isn't valid."""
+    try:
+        return _loads(data)
+    except _DECODE_ERRORS:
+        if BACKEND == "json":
+            raise
+        # The standard library also accepts NaN and Infinity, and raises ValueError otherwise
+        return json.loads(data)
+
+
+def load(path: str) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -0,0 +1,72 @@
+import gzip
+import logging
+from typing import IO, Any, Dict, Iterator
+
+from src import jsonio
+
+logger = logging.getLogger(__name__)
+
+# Extensions of JSON Lines files, plain or compressed
+JSONL_EXTENSIONS = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+
+
+def is_jsonl(path: str) -> bool:
+    """Whether a path names a JSON Lines file, compressed or not."""
+    return path.endswith(JSONL_EXTENSIONS)
+
+
+def open_jsonl(path: str, mode: str = "r") -> IO[str]:
+    """
+    Open a JSON Lines file as text, compressed according to its extension.
+
+    Files ending in .gz are gzip-compressed and files ending in .zst are
+    zstd-compressed, which needs the zstandard package.
+
+    Args:
+        path: Path of the file
+        mode: "r" to read, "w" to write or "a" to append. Appending to a
+            compressed file adds a new compressed stream, which readers
+            decompress as if it were one
+
+    Returns:
+        A text file object
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("Reading and writing .zst files needs the zstandard package: "
+                              "pip install zstandard") from None
+        return zstandard.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the records of a JSON Lines file one at a time.
+
+    A file written by a crawl that was killed may end in a line or a
+    compressed block that was cut short. Everything before it is read and the
+    rest is skipped with a warning.
+
+    Args:
+        path: Path of the file
+
+    Yields:
+        The record on each line
+    """
+    with open_jsonl(path) as f:
+        try:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield jsonio.loads(line)
+                except ValueError:
+                    if line.endswith("\n"):
+                        raise
+                    logger.warning("Skipping incomplete last line of %s", path)
+        except (EOFError, gzip.BadGzipFile) as e:
+            logger.warning("%s ends early, skipping the rest: %s", path, e)
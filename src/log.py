@@ -0,0 +1,94 @@
+import sys
+import json
+import time
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+# Level and format set by setup_logging, so parse worker processes can copy them
+_settings: Optional[Tuple[int, bool]] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats every record as a JSON object on a single line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets through at most `burst` warnings with the same message every `interval` seconds.
+
+    Records are grouped by their unformatted message, so a warning logged for
+    every listing of a broken page is only formatted a few times. The first
+    record let through after some were dropped tells how many were.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 60.0, min_level: int = logging.WARNING):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.min_level = min_level
+        self._lock = threading.Lock()
+        # (start of the interval, records let through, records dropped) per message
+        self._seen: Dict[Tuple[str, str], Tuple[float, int, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            start, count, dropped = self._seen.get(key, (now, 0, 0))
+            if now - start >= self.interval:
+                start, count = now, 0
+            if count >= self.burst:
+                self._seen[key] = (start, count, dropped + 1)
+                return False
+            self._seen[key] = (start, count + 1, 0)
+
+        if dropped:
+            record.msg = f"{record.msg} ({dropped} similar messages suppressed)"
+        return True
+
+
+def setup_logging(level: int = logging.INFO, json_format: bool = False) -> None:
+    """
+    Send log records to stderr, replacing any handlers set up before.
+
+    Args:
+        level: Lowest level to log
+        json_format: Whether to write one JSON object per record instead of text
+    """
+    global _settings
+    _settings = (level, json_format)
+
+    handler = logging.StreamHandler(sys.stderr)
+    if json_format:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s", "%H:%M:%S"))
+    handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    for old in root.handlers[:]:
+        root.removeHandler(old)
+    root.addHandler(handler)
+    root.setLevel(level)
+    # urllib3 logs every connection it opens at debug level
+    logging.getLogger("urllib3").setLevel(max(level, logging.INFO))
+
+
+def logging_settings() -> Optional[Tuple[int, bool]]:
+    """Get the arguments setup_logging was last called with, or None if it wasn't."""
+    return _settings
@@ -0,0 +1,83 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class CrawlMetrics:
+    """
+    Where a crawl spends its time, collected from every thread.
+
+    The phases are:
+        request: Sending requests and waiting for the response headers,
+            including DNS lookups and connecting
+        transfer: Downloading response bodies
+        parse: Building parse trees from HTML
+        extract: Reading the fields out of the parse trees
+        sleep: Waiting for the rate limiter, for retries and while the site is down
+        save: Writing the results to disk
+    """
+
+    PHASES = ("request", "transfer", "parse", "extract", "sleep", "save")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds: Dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self.latencies: List[float] = []
+        self.bytes = 0
+        self._started = time.perf_counter()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase."""
+        with self._lock:
+            self.seconds[phase] += seconds
+
+    def add_timings(self, timings: Dict[str, float]) -> None:
+        """Add the time spent in several phases, keyed by phase."""
+        with self._lock:
+            for phase, seconds in timings.items():
+                self.seconds[phase] += seconds
+
+    @contextmanager
+    def timed(self, phase: str):
+        """Add the time spent in a with block to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def add_response(self, latency: float, size: int) -> None:
+        """
+        Record a response.
+
+        Args:
+            latency: Seconds from sending the request until the body was read
+            size: Number of bytes received
+        """
+        with self._lock:
+            self.latencies.append(latency)
+            self.bytes += size
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Get a percentile (0-100) of the response latencies, or None without responses."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, max(0, round(p / 100 * len(latencies)) - 1))
+        return latencies[index]
+
+    def report(self) -> str:
+        """Summarize the metrics for printing."""
+        wall = time.perf_counter() - self._started
+        lines = [f"Time spent (summed over all threads, {wall:.1f} s wall time):"]
+        for phase in self.PHASES:
+            lines.append(f"  {phase:<10} {self.seconds[phase]:8.2f} s")
+
+        lines.append(f"Requests: {len(self.latencies)}, {self.bytes / (1024 * 1024):.1f} MB transferred")
+        if self.latencies:
+            lines.append("Latency: " + ", ".join(
+                f"p{p} {self.percentile(p):.3f} s" for p in (50, 90, 99)
+            ) + f", max {max(self.latencies):.3f} s")
+        return "\n".join(lines)
@@ -0,0 +1,123 @@
+from typing import Any, Dict, List, Optional
+
+from src.records import INTERNED_FIELDS, Traineeship
+from src.writers import StreamWriter
+
+
+def import_pyarrow():
+    """Import pyarrow and pyarrow.parquet, which are only needed for Parquet files."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Reading and writing Parquet files needs the pyarrow package: "
+                          "pip install pyarrow") from None
+    return pyarrow, pyarrow.parquet
+
+
+class ParquetStreamWriter(StreamWriter):
+    """
+    Writes traineeships to a Parquet file, a row group at a time.
+
+    The fields that repeat across listings (company, location, duration,
+    dates and field) are dictionary-encoded, so each distinct value is stored
+    once per row group, and readers get them back as dictionary arrays
+    (categoricals in pandas). Columns are compressed with zstd. Columns other
+    than the Traineeship fields get the type of their first values.
+    """
+
+    def __init__(self, path: str, fieldnames: List[str], row_group_size: int = 10000):
+        """
+        Start writing a Parquet file.
+
+        Args:
+            path: Path of the file
+            fieldnames: Columns of the file. Missing fields are left empty and
+                fields that aren't columns are left out
+            row_group_size: Number of traineeships buffered and written together
+        """
+        self.fieldnames = fieldnames
+        self.row_group_size = row_group_size
+        self._pa, self._pq = import_pyarrow()
+        self._rows: List[Dict[str, Any]] = []
+        self._writer = None
+        super().__init__(path)
+
+    def _open(self, path: str):
+        return open(path, 'wb')
+
+    def _write(self, traineeship: Dict[str, Any]) -> None:
+        self._rows.append(traineeship)
+        if len(self._rows) >= self.row_group_size:
+            self._flush_rows()
+
+    def _finish(self) -> None:
+        if self._rows or self._writer is None:
+            self._flush_rows()
+        self._writer.close()
+
+    def _schema(self):
+        pa = self._pa
+        fields = []
+        for name in self.fieldnames:
+            if name in INTERNED_FIELDS:
+                type_ = pa.dictionary(pa.int32(), pa.string())
+            elif name == "page_number":
+                type_ = pa.int64()
+            elif name in ("title", "url", "description"):
+                type_ = pa.string()
+            else:
+                type_ = pa.array([row.get(name) for row in self._rows]).type
+                if pa.types.is_null(type_):
+                    type_ = pa.string()
+            fields.append(pa.field(name, type_))
+        return pa.schema(fields)
+
+    def _flush_rows(self) -> None:
+        """Write the buffered traineeships as a row group."""
+        pa = self._pa
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._file, self._schema(), compression="zstd")
+        columns = []
+        for field in self._writer.schema:
+            values = [row.get(field.name) for row in self._rows]
+            if pa.types.is_dictionary(field.type):
+                columns.append(pa.array(values, pa.string()).dictionary_encode())
+            else:
+                columns.append(pa.array(values, field.type))
+        self._writer.write_table(pa.Table.from_arrays(columns, schema=self._writer.schema))
+        self._rows = []
+
+
+def read_parquet(path: str, columns: Optional[List[str]] = None) -> List[Traineeship]:
+    """
+    Read the traineeships in a Parquet file.
+
+    Args:
+        path: Path of the file
+        columns: Only read these columns (None for all). Columns the file
+            doesn't have are skipped, and fields that aren't read keep their
+            default values
+
+    Returns:
+        List of Traineeship records
+    """
+    pa, pq = import_pyarrow()
+    if columns is not None:
+        names = set(pq.read_schema(path).names)
+        columns = [name for name in columns if name in names]
+    table = pq.read_table(path, columns=columns)
+    names = table.column_names
+    values = [_column_values(pa, table.column(name)) for name in names]
+    return [Traineeship.from_dict(dict(zip(names, row))) for row in zip(*values)]
+
+
+def _column_values(pa, column) -> List[Any]:
+    """Convert a column to Python values, decoding each value of a dictionary column only once."""
+    if not pa.types.is_dictionary(column.type):
+        return column.to_pylist()
+    values = []
+    for chunk in column.chunks:
+        dictionary = chunk.dictionary.to_pylist()
+        values.extend(None if i is None else dictionary[i] for i in chunk.indices.to_pylist())
+    return values
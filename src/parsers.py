@@ -0,0 +1,145 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# HTML parser backends the scraper can use
+PARSERS = ("html.parser", "lxml", "html5lib", "selectolax")
+
+# Elements whose text BeautifulSoup leaves out of get_text()
+_NON_TEXT_TAGS = {"script", "style", "template"}
+
+
+def class_strainer(class_names: Iterable[str]) -> SoupStrainer:
+    """
+    Build a SoupStrainer that keeps the elements with any of the given classes.
+
+    Each kept element comes with its whole subtree, everything else on the
+    page (navigation, footer, scripts, ...) is never turned into tags.
+    """
+    wanted = frozenset(class_names)
+
+    def has_wanted_class(value: Optional[str]) -> bool:
+        # Depending on the bs4 version this gets single classes or the whole attribute
+        return value is not None and not wanted.isdisjoint(value.split())
+
+    return SoupStrainer(class_=has_wanted_class)
+
+
+def make_soup(html: str, parser: str = "html.parser", parse_only: Optional[SoupStrainer] = None) -> Any:
+    """
+    Parse an HTML document with the given backend.
+
+    Args:
+        html: The HTML to parse
+        parser: One of PARSERS. "selectolax" uses the lexbor engine, the others
+            are BeautifulSoup tree builders
+        parse_only: Only build the parts of the document this strainer keeps.
+            Ignored by html5lib, which doesn't support it, and by selectolax,
+            which always builds the whole tree
+
+    Returns:
+        A BeautifulSoup object, or a LexborSoup with the same interface
+    """
+    if parser == "selectolax":
+        return LexborSoup(html)
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown HTML parser '{parser}', expected one of {', '.join(PARSERS)}")
+    if parser == "html5lib":
+        parse_only = None
+    return BeautifulSoup(html, parser, parse_only=parse_only)
+
+
+class LexborNode:
+    """
+    A selectolax node with the subset of the BeautifulSoup Tag interface the
+    scraper uses, so the same extraction code runs on both backends.
+    """
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def name(self) -> str:
+        """Tag name of the element."""
+        return self.node.tag
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        """Attributes of the element, with the class attribute split into a list."""
+        attrs = {key: value if value is not None else "" for key, value in self.node.attributes.items()}
+        if "class" in attrs:
+            attrs["class"] = attrs["class"].split()
+        return attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get an attribute value."""
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.attrs[key]
+
+    def select(self, selector: str) -> List["LexborNode"]:
+        """Get the descendants matching a CSS selector."""
+        # Unlike soupsieve, lexbor also matches the node itself
+        own_id = self.node.mem_id
+        return [LexborNode(n) for n in self.node.css(selector) if n.mem_id != own_id]
+
+    def select_one(self, selector: str) -> Optional["LexborNode"]:
+        """Get the first descendant matching a CSS selector, or None."""
+        own_id = self.node.mem_id
+        for n in self.node.css(selector):
+            if n.mem_id != own_id:
+                return LexborNode(n)
+        return None
+
+    @property
+    def children(self) -> Iterator["LexborNode"]:
+        """Child elements, without text and comment nodes."""
+        for child in self.node.iter(include_text=False):
+            if child.is_element_node:
+                yield LexborNode(child)
+
+    @property
+    def parent(self) -> Optional["LexborNode"]:
+        """Parent element, or None at the top of the document."""
+        parent = self.node.parent
+        return LexborNode(parent) if parent is not None and parent.is_element_node else None
+
+    def _strings(self) -> Iterator[str]:
+        """Yield the text nodes below this node, like BeautifulSoup's _all_strings."""
+        for n in self.node.traverse(include_text=True):
+            if n.is_text_node:
+                parent = n.parent
+                if parent is not None and parent.tag in _NON_TEXT_TAGS:
+                    continue
+                yield n.text_content or ""
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        """Get the text below this node, joined like BeautifulSoup's get_text."""
+        strings = self._strings()
+        if strip:
+            strings = (s.strip() for s in strings)
+            strings = (s for s in strings if s)
+        return separator.join(strings)
+
+    @property
+    def text(self) -> str:
+        """All text below this node."""
+        return self.get_text()
+
+    def __str__(self) -> str:
+        return self.node.html or ""
+
+
+class LexborSoup(LexborNode):
+    """A document parsed with selectolax's lexbor engine."""
+
+    __slots__ = ()
+
+    def __init__(self, html: str):
+        # Imported here so selectolax is only needed when this backend is used
+        from selectolax.lexbor import LexborHTMLParser
+        super().__init__(LexborHTMLParser(html).root)
@@ -0,0 +1,114 @@
+import time
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Number of seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """
+    A token bucket shared by every request of a crawl.
+
+    The rate increases a little after every fast response, is cut in half when
+    the server answers 429 or 503, and drops while responses are slow. A
+    Retry-After header pauses all requests for as long as the server asks.
+    """
+
+    def __init__(self, rate: float = 0.5, burst: int = 2, min_rate: float = 0.1,
+                 max_rate: float = 4.0, slow_latency: float = 2.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Initial number of requests per second
+            burst: Maximum number of requests that can be made back to back
+            min_rate: Lowest rate to back off to
+            max_rate: Highest rate to speed up to
+            slow_latency: Response time in seconds above which the rate is reduced
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, min_rate), self.max_rate)
+        self.burst = max(1, burst)
+        self.slow_latency = slow_latency
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (caller holds the lock)."""
+        # No tokens are earned during a pause, when the last update is in the future
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be made.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Take the token now, so concurrent callers queue up behind each other
+            self._tokens -= 1
+            # Callers queued during a pause follow each other at the current rate once it ends
+            wait = max(0.0, self._paused_until - now) + max(0.0, -self._tokens) / self.rate
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_response(self, status_code: int, latency: float, retry_after: Optional[str] = None) -> None:
+        """
+        Adapt the rate to a response from the server.
+
+        Args:
+            status_code: HTTP status code of the response
+            latency: Time in seconds until the response arrived
+            retry_after: Value of the Retry-After header, if any
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if status_code in (429, 503):
+                self.rate = max(self.min_rate, self.rate / 2)
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    self._paused_until = max(self._paused_until, now + delay)
+                    # Tokens are only earned again once the pause is over
+                    self._updated = self._paused_until
+                    self._tokens = min(self._tokens, 0.0)
+            elif latency > self.slow_latency:
+                self.rate = max(self.min_rate, self.rate * 0.8)
+            elif status_code < 400:
+                self.rate = min(self.max_rate, self.rate + 0.05)
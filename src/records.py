@@ -0,0 +1,95 @@
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+# Fields that take a few distinct values across a whole crawl. Interning them
+# makes every record share one string object per value.
+INTERNED_FIELDS = ("company", "location", "duration", "post_date", "deadline", "field")
+
+
+@dataclass(slots=True)
+class Traineeship:
+    """
+    A scraped traineeship.
+
+    Uses slots instead of a per-record dict, and interns the fields that repeat
+    across listings, so large datasets take a fraction of the memory of plain
+    dictionaries. A description of None means the detail page wasn't fetched.
+    Keys of loaded records that aren't fields (the match probabilities added by
+    rank_jobs.py, for example) are kept in `extra`.
+    """
+
+    title: str = "Not specified"
+    company: str = "Not specified"
+    location: str = "Not specified"
+    duration: str = "Not specified"
+    post_date: str = "Not specified"
+    deadline: str = "Not specified"
+    field: str = "Not specified"
+    url: str = ""
+    page_number: int = 0
+    description: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        for name in INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+    def __reduce__(self):
+        # Rebuild through __init__ when unpickled (records coming back from parse
+        # worker processes), so the strings are interned in this process too
+        return self.__class__, tuple(getattr(self, name) for name in FIELD_NAMES + ["extra"])
+
+    @property
+    def country(self) -> str:
+        """Country of the traineeship, the last part of its location."""
+        return self.location.rsplit(",", 1)[-1].strip()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field or extra value by name, like dict.get."""
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dictionary, as the scraper wrote records before.
+
+        The description is left out when it wasn't fetched and extra values
+        come after the fields.
+        """
+        data = {
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "duration": self.duration,
+            "post_date": self.post_date,
+            "deadline": self.deadline,
+            "field": self.field,
+            "url": self.url,
+            "page_number": self.page_number,
+        }
+        if self.description is not None:
+            data["description"] = self.description
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Traineeship":
+        """Build a record from a dictionary, such as a record loaded from a CSV or JSON file."""
+        values = {}
+        extra = {}
+        for key, value in data.items():
+            if key in _FIELD_SET:
+                values[key] = value
+            else:
+                extra[key] = value
+        return cls(**values, extra=extra or None)
+
+
+FIELD_NAMES = [f.name for f in fields(Traineeship) if f.name != "extra"]
+_FIELD_SET = frozenset(FIELD_NAMES)
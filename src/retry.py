@@ -0,0 +1,111 @@
+import time
+import random
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlAborted(Exception):
+    """Raised when a crawl has failed too many requests to carry on."""
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff with an error budget for the whole crawl.
+
+    Every failed attempt spends one unit of the budget, except for responses
+    asking the crawler to slow down. Once the budget is used up, the crawl is
+    aborted instead of failing its remaining requests one by one.
+    """
+
+    # Responses worth trying again; other errors won't go away by retrying
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    # Responses asking the crawler to slow down. They are retried, but they
+    # aren't failures of the site and don't spend the error budget
+    THROTTLE_STATUS_CODES = {429}
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0,
+                 error_budget: int = 100):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Number of times a failed request is retried
+            base_delay: Backoff in seconds before the first retry
+            max_delay: Longest backoff in seconds
+            error_budget: Number of failed attempts allowed in a crawl (0 for no limit)
+        """
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.error_budget = error_budget
+
+        self._lock = threading.Lock()
+        self.errors = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Get the delay before retry number `attempt` (starting at 0), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def spend_error(self, reason: str) -> None:
+        """
+        Record a failed attempt.
+
+        Raises:
+            CrawlAborted: If the error budget is used up
+        """
+        with self._lock:
+            self.errors += 1
+            errors = self.errors
+        if self.error_budget and errors > self.error_budget:
+            raise CrawlAborted(f"Giving up after {errors} failed requests (last error: {reason})")
+
+
+class CircuitBreaker:
+    """
+    Pauses every request when the site keeps failing.
+
+    After `failure_threshold` consecutive failures the breaker opens and all
+    requests wait for `cooldown` seconds. The first failure after a pause opens
+    it again straight away, while a success closes it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 60.0):
+        """Initialize the breaker with the number of failures that open it and the pause in seconds."""
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+
+    def wait(self) -> float:
+        """
+        Wait while the breaker is open.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        with self._lock:
+            wait = self._open_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+            return wait
+        return 0.0
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker after too many in a row."""
+        with self._lock:
+            self._failures += 1
+            now = time.monotonic()
+            if self._failures >= self.failure_threshold and now >= self._open_until:
+                self._open_until = now + self.cooldown
+                # One more failure after the pause is enough to open it again
+                self._failures = self.failure_threshold - 1
+                logger.warning("Site seems to be down, pausing crawl for %.0f seconds", self.cooldown)
@@ -1,12 +1,309 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import pandas as pd
+import asyncio
+import dataclasses
 import time
-import random
-import json
+import logging
 import os
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Container, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from src import jsonio
+from src.archive import ResponseArchive
+from src.checkpoint import CrawlCheckpoint
+from src.http_cache import ResponseCache
+from src.log import logging_settings, setup_logging
+from src.metrics import CrawlMetrics
+from src.extract import ExtractionPlan
+from src.parquet import ParquetStreamWriter
+from src.parsers import make_soup, class_strainer
+from src.records import Traineeship
+from src.rate_limit import AdaptiveRateLimiter
+from src.retry import RetryPolicy, CircuitBreaker
+from src.streaming import FieldWatcher, read_until_done
+from src.writers import JsonLinesStreamWriter
+
+
+logger = logging.getLogger(__name__)
+
+# Only the parts of a page the extractors read are parsed: the listings and the
+# pager on listing pages, and the description, date and duration on detail pages
+LISTING_PAGE_STRAINER = class_strainer([
+    "media-list-items", "view-content", "pager-last", "pager-item", "pager-current",
+])
+# Fields of a traineeship scraped from its listing, and the ones added from its detail page
+LISTING_FIELDS = ["title", "company", "location", "duration", "post_date", "deadline", "field", "url", "page_number"]
+DETAIL_FIELDS = ["description"]
+
+# Classes of the blocks holding each field of a detail page
+DETAIL_FIELD_CLASSES = {
+    "post_date": ("field-name-field-date-posted", "date-posted"),
+    "duration": ("field-name-field-duration", "duration"),
+    "description": ("field-name-body", "description"),
+}
+DETAIL_PAGE_STRAINER = class_strainer(c for classes in DETAIL_FIELD_CLASSES.values() for c in classes)
+
+# Selectors for the fields of a listing, tried in order until one matches
+TITLE_SELECTORS = ['.field-name-title a, h3.dot-title a', 'h3.title a, .media-body a']
+COMPANY_SELECTOR = '.field-name-recruiter-name .field-item a'
+COUNTRY_SELECTOR = '.field-name-field-traineeship-location-count .field-item'
+CITY_SELECTOR = '.field-name-field-traineeship-location-city .field-item'
+DURATION_SELECTORS = [
+    '.ds-top-footer .field-name-field-traineeship-duration .field-items .field-item',
+    '.ds-top-footer .field-name-field-traineeship-duration',
+    '.field-name-field-traineeship-duration .field-item',
+    '.field-type-taxonomy-term-reference.field-name-field-traineeship-duration .field-items .field-item'
+]
+POST_DATE_SELECTORS = [
+    '.ds-top-footer .field-name-post-date .field-items .field-item',
+    '.ds-top-footer .field-name-post-date',
+    '.field-name-post-date .field-item',
+    '.field-type-ds.field-name-post-date .field-items .field-item'
+]
+DEADLINE_SELECTOR = '.ds-top-footer .field-name-field-traineeship-apply-deadline'
+# Looked up inside the deadline field
+DEADLINE_ITEM_SELECTORS = ['.field-items .field-item .date-display-single', '.field-items .field-item']
+FIELD_SELECTOR = '.ds-top-content h5'
+
+# All listing selectors, matched in a single walk over each listing
+LISTING_PLAN = ExtractionPlan(
+    TITLE_SELECTORS + [COMPANY_SELECTOR, COUNTRY_SELECTOR, CITY_SELECTOR]
+    + DURATION_SELECTORS + POST_DATE_SELECTORS + [DEADLINE_SELECTOR, FIELD_SELECTOR],
+    scoped={DEADLINE_SELECTOR: DEADLINE_ITEM_SELECTORS},
+)
+
+
+def count_pages(soup: Any) -> int:
+    """Get the total number of listing pages from the pager of a parsed listing page."""
+    try:
+        # Try to find the last page number
+        pager = soup.select('.pager-last a')
+        if pager:
+            href = pager[0].get('href', '')
+            if 'page=' in href:
+                return int(href.split('page=')[1]) + 1
+        
+        # If no last page button, try counting page items
+        pager_items = soup.select('.pager-item a, .pager-current')
+        if pager_items:
+            pages = []
+            for item in pager_items:
+                try:
+                    if 'href' in item.attrs:
+                        num = int(item['href'].split('page=')[1]) + 1
+                    else:
+                        num = int(item.text.strip())
+                    pages.append(num)
+                except (ValueError, IndexError):
+                    continue
+            return max(pages) if pages else 1
+        
+        return 1
+        
+    except Exception as e:
+        logger.warning("Error determining total pages: %s", e)
+        return 1
+
+
+def extract_listings(soup: Any, page_num: int) -> List[Traineeship]:
+    """Extract the traineeships from a parsed listing page."""
+    traineeships = []
+    # Look for individual traineeship items
+    listing_container = soup.select('.media-list-items')
+    
+    if not listing_container:
+        logger.debug("Listing container not found, trying alternative selector")
+        listing_container = soup.select('.view-content > div')
+    
+    logger.debug("Found %d listing containers", len(listing_container))
+    
+    for container in listing_container:
+        try:
+            # First match of every selector in one pass over the listing
+            found = LISTING_PLAN.first_matches(container)
+            
+            # Title and link, trying alternate selectors in order
+            title_elem = next((found[s] for s in TITLE_SELECTORS if s in found), None)
+            
+            if not title_elem:
+                logger.warning("Skipping listing without a title on page %d", page_num)
+                continue
+                
+            title = title_elem.text.strip()
+            link = title_elem['href']
+            if not link.startswith('http'):
+                link = f"https://erasmusintern.org{link}"
+            
+            # Company name
+            company_elem = found.get(COMPANY_SELECTOR)
+            company = company_elem.text.strip() if company_elem else "Not specified"
+            
+            # Location
+            country_elem = found.get(COUNTRY_SELECTOR)
+            city_elem = found.get(CITY_SELECTOR)
+            location = ""
+            if city_elem and country_elem:
+                location = f"{city_elem.text.strip()}, {country_elem.text.strip()}"
+            elif country_elem:
+                location = country_elem.text.strip()
+            else:
+                location = "Not specified"
+            
+            # Duration - complete refactor with debug info
+            duration = "Not specified"
+            # Try all possible selectors in order
+            for selector in DURATION_SELECTORS:
+                duration_elem = found.get(selector)
+                if duration_elem:
+                    # Get the text and remove any labels
+                    text = duration_elem.get_text(strip=True)
+                    if "Duration:" in text:
+                        duration = text.replace("Duration:", "").strip()
+                    else:
+                        duration = text
+                    logger.debug("Found duration '%s' using selector '%s'", duration, selector)
+                    break
+            
+            # Post date - complete refactor with debug info
+            post_date = "Not specified"
+            # Try all possible selectors in order
+            for selector in POST_DATE_SELECTORS:
+                post_date_elem = found.get(selector)
+                if post_date_elem:
+                    # Get the text and remove any labels
+                    text = post_date_elem.get_text(strip=True)
+                    if "Post date:" in text:
+                        post_date = text.replace("Post date:", "").strip()
+                    else:
+                        post_date = text
+                    logger.debug("Found post date '%s' using selector '%s'", post_date, selector)
+                    break
+            
+            # Deadline - revised to follow same pattern
+            deadline = "Not specified"
+            deadline_item = next((found[(DEADLINE_SELECTOR, s)] for s in DEADLINE_ITEM_SELECTORS
+                                  if (DEADLINE_SELECTOR, s) in found), None)
+            if deadline_item:
+                deadline = deadline_item.text.strip()
+            
+            # Field of study
+            field = "Not specified"
+            field_elem = found.get(FIELD_SELECTOR)
+            if field_elem:
+                field = field_elem.text.strip()
+            
+            logger.debug("Listing %s - Title: %s, Company: %s, Duration: %s, Post date: %s",
+                         link, title, company, duration, post_date)
+            
+            traineeship = Traineeship(
+                title=title,
+                company=company,
+                location=location,
+                duration=duration,
+                post_date=post_date,
+                deadline=deadline,
+                field=field,
+                url=link,
+                page_number=page_num
+            )
+            
+            traineeships.append(traineeship)
+            
+        except Exception as e:
+            logger.warning("Error extracting traineeship data on page %d: %s", page_num, e, exc_info=True)
+            continue
+    
+    if not traineeships:
+        logger.warning("No traineeships found on page %d", page_num)
+        # Only look up the markup when it is going to be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Listing markup: %s", soup.select_one('.view-content'))
+    
+    return traineeships
+
+
+def extract_details(soup: Any, traineeship: Traineeship) -> Traineeship:
+    """Add the fields found on a parsed detail page to a copy of its traineeship."""
+    # Updated field selectors - removed unwanted fields including start_date
+    fields = {
+        "post_date": ".field-name-field-date-posted .field-item, .date-posted",
+        "duration": ".field-name-field-duration .field-item, .duration",
+        "description": ".field-name-body .field-item, .description",
+    }
+    
+    details = {}
+    for field_name, selector in fields.items():
+        # Skip fields that already have valid data
+        if getattr(traineeship, field_name) not in (None, "Not specified"):
+            continue
+            
+        elements = soup.select(selector)
+        if elements:
+            if field_name == "website":
+                details[field_name] = elements[0].get('href', '')
+            else:
+                # Clean up the text content
+                text = elements[0].get_text(strip=True, separator=' ')
+                # Remove field labels if present
+                if ':' in text:
+                    text = text.split(':', 1)[1].strip()
+                details[field_name] = text
+        else:
+            details[field_name] = "Not specified"
+    
+    # Copy the traineeship with only the missing fields filled in
+    return dataclasses.replace(traineeship, **details)
+
+
+def parse_listing_page(html: str, page_num: int, parser: str = "html.parser") -> Dict[str, Any]:
+    """
+    Parse a listing page.
+    
+    Like parse_detail_page, this only takes and returns plain values so that
+    it can run in a parse worker process.
+    
+    Args:
+        html: The HTML of the page
+        page_num: Number of the page (starting at 1)
+        parser: HTML parser backend, one of src.parsers.PARSERS
+        
+    Returns:
+        A dict with the total number of pages ("total_pages"), the
+        traineeships listed on the page ("traineeships") and the seconds
+        spent parsing and extracting ("timings")
+    """
+    start = time.perf_counter()
+    soup = make_soup(html, parser, LISTING_PAGE_STRAINER)
+    parsed = time.perf_counter()
+    page = {"total_pages": count_pages(soup), "traineeships": extract_listings(soup, page_num)}
+    page["timings"] = {"parse": parsed - start, "extract": time.perf_counter() - parsed}
+    return page
+
+
+def parse_detail_page(html: str, traineeship: Traineeship, parser: str = "html.parser") -> Dict[str, Any]:
+    """
+    Parse a detail page.
+    
+    Args:
+        html: The HTML of the page
+        traineeship: The traineeship as scraped from its listing page
+        parser: HTML parser backend, one of src.parsers.PARSERS
+        
+    Returns:
+        A dict with a copy of the traineeship with the fields found on the page
+        added ("traineeship") and the seconds spent parsing and extracting ("timings")
+    """
+    start = time.perf_counter()
+    soup = make_soup(html, parser, DETAIL_PAGE_STRAINER)
+    parsed = time.perf_counter()
+    result = extract_details(soup, traineeship)
+    return {"traineeship": result, "timings": {"parse": parsed - start, "extract": time.perf_counter() - parsed}}
 
 
 class ErasmusInternScraper:
@@ -14,10 +311,60 @@ class ErasmusInternScraper:
     A scraper for collecting traineeship listings from erasmusintern.org
     """
     
-    def __init__(self, base_url: str = "https://erasmusintern.org/traineeships", data_dir: str = "data"):
-        """Initialize the scraper with the base URL and data directory."""
+    # Seconds to wait for the server before a request counts as failed
+    request_timeout = 30
+    
+    def __init__(self, base_url: str = "https://erasmusintern.org/traineeships", data_dir: str = "data",
+                 cache_dir: Optional[str] = None, cache_size_mb: int = 200,
+                 checkpoint_file: Optional[str] = None, resume: bool = False,
+                 rate_limit: float = 0.5, rate_burst: int = 2, max_rate_limit: float = 4.0,
+                 max_retries: int = 3, error_budget: int = 100,
+                 breaker_threshold: int = 5, breaker_cooldown: float = 60.0,
+                 parser: str = "html.parser", parse_workers: int = 0, stream_details: bool = False,
+                 record_dir: Optional[str] = None, replay_dir: Optional[str] = None):
+        """
+        Initialize the scraper with the base URL and data directory.
+        
+        Args:
+            base_url: URL of the first listing page
+            data_dir: Directory the scraped data is saved to
+            cache_dir: Directory for the detail page cache (None to disable caching)
+            cache_size_mb: Maximum size of the detail page cache in megabytes
+            checkpoint_file: Journal recording the crawl's progress (None to disable)
+            resume: Whether to skip the pages and details already in the journal
+            rate_limit: Initial number of requests per second (0 for no limit)
+            rate_burst: Maximum number of requests that can be made back to back
+            max_rate_limit: Highest number of requests per second to speed up to
+            max_retries: Number of times a request is retried after a transient failure
+            error_budget: Number of failed attempts after which the crawl is aborted (0 for no limit)
+            breaker_threshold: Number of failures in a row that pause the crawl
+            breaker_cooldown: Seconds the crawl is paused for when the site seems down
+            parser: HTML parser backend, one of src.parsers.PARSERS
+            parse_workers: Number of processes pages are parsed in (0 to parse them
+                in this process). Call close() to stop them when done
+            stream_details: Whether to stop downloading a detail page once the
+                fields still missing from its listing have been read
+            record_dir: Directory to record every downloaded page to (None to disable)
+            replay_dir: Directory of a recorded crawl to serve every page from,
+                without any network (None to disable)
+        """
+        if record_dir and replay_dir:
+            raise ValueError("A crawl can't be recorded and replayed at the same time")
+        
         self.base_url = base_url
         self.data_dir = data_dir
+        self.parser = parser
+        self.stream_details = stream_details
+        
+        # Record the crawl for offline runs, or serve a recorded one
+        self.archive = None
+        if replay_dir:
+            self.archive = ResponseArchive(replay_dir, replay=True)
+            if self.archive.base_url != base_url:
+                logger.info("Replaying the recorded crawl of %s", self.archive.base_url)
+                self.base_url = self.archive.base_url
+        elif record_dir:
+            self.archive = ResponseArchive(record_dir, base_url)
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
@@ -27,320 +374,597 @@ class ErasmusInternScraper:
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         })
+        
+        # Detail pages rarely change after posting, so keep them and revalidate on later runs
+        self.cache = ResponseCache(cache_dir, max_bytes=cache_size_mb * 1024 * 1024) if cache_dir else None
+        
+        # Journal finished work so an interrupted crawl can pick up where it stopped
+        self.checkpoint = CrawlCheckpoint(checkpoint_file, self.base_url, resume=resume) if checkpoint_file else None
+        
+        # All requests share one rate limiter that adapts to how the server is coping
+        self.rate_limiter = None
+        if rate_limit > 0:
+            self.rate_limiter = AdaptiveRateLimiter(rate=rate_limit, burst=rate_burst,
+                                                    max_rate=max(rate_limit, max_rate_limit))
+        
+        # Retry transient failures, but stop hammering the site when it is down
+        self.retry_policy = RetryPolicy(max_retries=max_retries, error_budget=error_budget)
+        self.circuit_breaker = CircuitBreaker(failure_threshold=breaker_threshold, cooldown=breaker_cooldown)
+        
+        # Time spent in each phase of the crawl, reported by main.py when it is done
+        self.metrics = CrawlMetrics()
+        
+        # Parsing is CPU-bound and holds the GIL, so fetch threads can hand the
+        # HTML to worker processes and keep downloading meanwhile. The workers are
+        # spawned, forking while fetch threads are running can deadlock
+        self.parse_pool = None
+        if parse_workers > 0:
+            # Spawned workers start without logging set up, so give them the same
+            log_settings = logging_settings()
+            self.parse_pool = ProcessPoolExecutor(max_workers=parse_workers,
+                                                  mp_context=multiprocessing.get_context("spawn"),
+                                                  initializer=setup_logging if log_settings else None,
+                                                  initargs=log_settings or ())
+        
+        # First listing page, parsed by get_total_pages and reused for its listings
+        self._first_page = None
     
-    def get_total_pages(self) -> int:
-        """Get the total number of pages of traineeships."""
-        response = self.session.get(self.base_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+    def _fetch(self, url: str, use_cache: bool = False,
+               stop_after: Optional[List[Tuple[str, ...]]] = None) -> str:
+        """
+        Get the HTML of a page.
         
-        try:
-            # Try to find the last page number
-            pager = soup.select('.pager-last a')
-            if pager:
-                href = pager[0].get('href', '')
-                if 'page=' in href:
-                    return int(href.split('page=')[1]) + 1
-            
-            # If no last page button, try counting page items
-            pager_items = soup.select('.pager-item a, .pager-current')
-            if pager_items:
-                pages = []
-                for item in pager_items:
-                    try:
-                        if 'href' in item.attrs:
-                            num = int(item['href'].split('page=')[1]) + 1
-                        else:
-                            num = int(item.text.strip())
-                        pages.append(num)
-                    except (ValueError, IndexError):
-                        continue
-                return max(pages) if pages else 1
-            
-            return 1
+        When replaying, the page comes from the archive and nothing is
+        downloaded. When recording, every downloaded page is added to it.
+        
+        Args:
+            url: URL of the page
+            use_cache: See _download
+            stop_after: See _download
             
-        except Exception as e:
-            print(f"Error determining total pages: {e}")
-            return 1
-
-    def scrape_traineeship_listings(self, page_num: int) -> List[Dict[str, Any]]:
-        """Scrape the traineeship listings from a specific page."""
-        # Build URL properly with query parameters
-        if '?' in self.base_url:
-            url = f"{self.base_url}&page={page_num-1}"
-        else:
-            url = f"{self.base_url}?page={page_num-1}"
+        Returns:
+            The HTML of the page
             
-        print(f"Scraping page {page_num}: {url}")
+        Raises:
+            requests.RequestException: If the request fails, or the page isn't in the replayed archive
+            CrawlAborted: If the crawl's error budget is used up
+        """
+        if self.archive and self.archive.replay:
+            return self.archive.load(url)
         
-        try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+        html = self._download(url, use_cache, stop_after)
+        if self.archive:
+            self.archive.save(url, html)
+        return html
+    
+    def _download(self, url: str, use_cache: bool = False,
+                  stop_after: Optional[List[Tuple[str, ...]]] = None) -> str:
+        """
+        Download a page and return its HTML.
+        
+        Args:
+            url: URL of the page
+            use_cache: Whether to revalidate and reuse a cached copy of the page
+            stop_after: Groups of classes of the blocks the caller needs. If given,
+                the page is streamed and the download stops once a block of each
+                group has been read, so only the start of the page is returned
             
-            traineeships = []
-            # Look for individual traineeship items
-            listing_container = soup.select('.media-list-items')
+        Returns:
+            The HTML of the page
             
-            if not listing_container:
-                print("Debug: Container not found, trying alternative selector")
-                listing_container = soup.select('.view-content > div')
+        Raises:
+            requests.RequestException: If the request fails
+            CrawlAborted: If the crawl's error budget is used up
+        """
+        cached = self.cache.get(url) if use_cache and self.cache else None
+        headers = ResponseCache.conditional_headers(cached) if cached else None
+        
+        watcher = FieldWatcher(stop_after) if stop_after is not None else None
+        response = self._get_with_retries(url, headers, watcher)
+        if cached and response.status_code == 304:
+            self.cache.touch(url)
+            return cached["body"]
+        response.raise_for_status()
+        
+        # A page cut short may lack fields a later crawl needs, so it isn't cached
+        if use_cache and self.cache and not (watcher and watcher.done):
+            self.cache.store(url, response)
+        return response.text
+    
+    def _get_with_retries(self, url: str, headers: Optional[Dict[str, str]] = None,
+                          watcher: Optional[FieldWatcher] = None) -> requests.Response:
+        """
+        Make a GET request, retrying transient failures with jittered exponential backoff.
+        
+        Args:
+            url: URL to request
+            headers: Extra request headers
+            watcher: Stream the body and only read it until the watcher is done
             
-            print(f"Debug: Found {len(listing_container)} containers")
+        Returns:
+            The response, which may still have an error status that isn't worth retrying
             
-            for container in listing_container:
-                try:
-                    # Title and link
-                    title_elem = container.select_one('.field-name-title a, h3.dot-title a')
-                    if not title_elem:
-                        # Try alternate selectors for the title
-                        title_elem = container.select_one('h3.title a, .media-body a')
-                    
-                    if not title_elem:
-                        print("Skipping item - no title found")
-                        continue
-                        
-                    title = title_elem.text.strip()
-                    link = title_elem['href']
-                    if not link.startswith('http'):
-                        link = f"https://erasmusintern.org{link}"
-                    
-                    # Add debug print for link
-                    print(f"Found link: {link}")
-                    
-                    # Company name
-                    company_elem = container.select_one('.field-name-recruiter-name .field-item a')
-                    company = company_elem.text.strip() if company_elem else "Not specified"
-                    
-                    # Location
-                    country_elem = container.select_one('.field-name-field-traineeship-location-count .field-item')
-                    city_elem = container.select_one('.field-name-field-traineeship-location-city .field-item')
-                    location = ""
-                    if city_elem and country_elem:
-                        location = f"{city_elem.text.strip()}, {country_elem.text.strip()}"
-                    elif country_elem:
-                        location = country_elem.text.strip()
-                    else:
-                        location = "Not specified"
-                    
-                    # Duration - complete refactor with debug info
-                    duration = "Not specified"
-                    print("Debug - Looking for duration")
-                    # Try all possible selectors in order
-                    duration_selectors = [
-                        '.ds-top-footer .field-name-field-traineeship-duration .field-items .field-item',
-                        '.ds-top-footer .field-name-field-traineeship-duration',
-                        '.field-name-field-traineeship-duration .field-item',
-                        '.field-type-taxonomy-term-reference.field-name-field-traineeship-duration .field-items .field-item'
-                    ]
-                    
-                    for selector in duration_selectors:
-                        duration_elem = container.select_one(selector)
-                        if duration_elem:
-                            # Get the text and remove any labels
-                            text = duration_elem.get_text(strip=True)
-                            if "Duration:" in text:
-                                duration = text.replace("Duration:", "").strip()
-                            else:
-                                duration = text
-                            print(f"Found duration '{duration}' using selector '{selector}'")
-                            break
-                    
-                    # Post date - complete refactor with debug info
-                    post_date = "Not specified"
-                    print("Debug - Looking for post date")
-                    # Try all possible selectors in order
-                    post_date_selectors = [
-                        '.ds-top-footer .field-name-post-date .field-items .field-item',
-                        '.ds-top-footer .field-name-post-date',
-                        '.field-name-post-date .field-item',
-                        '.field-type-ds.field-name-post-date .field-items .field-item'
-                    ]
-                    
-                    for selector in post_date_selectors:
-                        post_date_elem = container.select_one(selector)
-                        if post_date_elem:
-                            # Get the text and remove any labels
-                            text = post_date_elem.get_text(strip=True)
-                            if "Post date:" in text:
-                                post_date = text.replace("Post date:", "").strip()
-                            else:
-                                post_date = text
-                            print(f"Found post date '{post_date}' using selector '{selector}'")
-                            break
-                    
-                    # Deadline - revised to follow same pattern
-                    deadline = "Not specified"
-                    deadline_container = container.select_one('.ds-top-footer .field-name-field-traineeship-apply-deadline')
-                    if deadline_container:
-                        deadline_item = deadline_container.select_one('.field-items .field-item .date-display-single')
-                        if deadline_item:
-                            deadline = deadline_item.text.strip()
-                        else:
-                            # Try alternate selector
-                            deadline_item = deadline_container.select_one('.field-items .field-item')
-                            if deadline_item:
-                                deadline = deadline_item.text.strip()
-                    
-                    # Field of study
-                    field = "Not specified"
-                    field_elem = container.select_one('.ds-top-content h5')
-                    if field_elem:
-                        field = field_elem.text.strip()
-                    
-                    # Add debug for each field
-                    print(f"Item data - Title: {title}, Company: {company}, Duration: {duration}, Post date: {post_date}")
-                    
-                    traineeship = {
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "duration": duration,
-                        "post_date": post_date,
-                        "deadline": deadline,
-                        "field": field,
-                        "url": link,
-                        "page_number": page_num
-                    }
-                    
-                    traineeships.append(traineeship)
-                    
-                except Exception as e:
-                    print(f"Error extracting traineeship data: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+        Raises:
+            requests.RequestException: If the request still fails after all retries
+            CrawlAborted: If the crawl's error budget is used up
+        """
+        for attempt in range(self.retry_policy.max_retries + 1):
+            self.metrics.add("sleep", self.circuit_breaker.wait())
+            if self.rate_limiter:
+                self.metrics.add("sleep", self.rate_limiter.acquire())
             
-            if not traineeships:
-                print("Warning: No traineeships found on page")
-                print("Debug HTML:")
-                print(soup.select_one('.view-content'))
+            throttled = False
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.request_timeout,
+                                            stream=watcher is not None)
+                if watcher is not None:
+                    read_until_done(response, watcher)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                self.metrics.add("request", time.perf_counter() - start)
+                error = e
             else:
-                print(f"Successfully extracted {len(traineeships)} traineeships from page {page_num}")
+                self._record_response(response, time.perf_counter() - start)
+                if self.rate_limiter:
+                    self.rate_limiter.on_response(response.status_code, response.elapsed.total_seconds(),
+                                                  response.headers.get("Retry-After"))
+                if response.status_code not in RetryPolicy.RETRY_STATUS_CODES:
+                    self.circuit_breaker.record_success()
+                    return response
+                error = requests.HTTPError(f"{response.status_code} Error for url: {url}", response=response)
+                throttled = response.status_code in RetryPolicy.THROTTLE_STATUS_CODES
+            
+            if not throttled:
+                self.circuit_breaker.record_failure()
+                self.retry_policy.spend_error(str(error))
+            if attempt < self.retry_policy.max_retries:
+                if throttled and self.rate_limiter:
+                    # The rate limiter has already slowed down and honours Retry-After
+                    delay = 0.0
+                else:
+                    delay = self.retry_policy.backoff(attempt)
+                logger.warning("Request to %s failed (%s), retrying in %.1f seconds", url, error, delay)
+                time.sleep(delay)
+                self.metrics.add("sleep", delay)
+        
+        raise error
+    
+    def _record_response(self, response: requests.Response, latency: float) -> None:
+        """Record the timing and size of a response whose body has been read."""
+        # elapsed ends when the headers arrived, the rest of the time went to the body
+        waited = min(latency, response.elapsed.total_seconds())
+        self.metrics.add_timings({"request": waited, "transfer": latency - waited})
+        try:
+            size = response.raw.tell()
+        except AttributeError:
+            size = len(response.content)
+        self.metrics.add_response(latency, size)
+    
+    def _page_url(self, page_num: int) -> str:
+        """Get the URL of a listing page (page numbers start at 1)."""
+        # Build URL properly with query parameters
+        if '?' in self.base_url:
+            return f"{self.base_url}&page={page_num-1}"
+        return f"{self.base_url}?page={page_num-1}"
+    
+    def _parse(self, func, *args):
+        """
+        Run a parse function in the parse worker pool, or in this process if there is none.
+        
+        The function's timings are added to the crawl's metrics.
+        """
+        if self.parse_pool is None:
+            result = func(*args)
+        else:
+            result = self.parse_pool.submit(func, *args).result()
+        self.metrics.add_timings(result["timings"])
+        return result
+    
+    def close(self) -> None:
+        """Shut down the parse worker processes, if any."""
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+    
+    def get_total_pages(self) -> int:
+        """
+        Get the total number of pages of traineeships.
+        
+        The pager is read from the first listing page, whose listings are kept
+        so that scrape_traineeship_listings(1) doesn't download and parse it again.
+        """
+        page = self._parse(parse_listing_page, self._fetch(self._page_url(1)), 1, self.parser)
+        self._first_page = page
+        return page["total_pages"]
+
+    def scrape_traineeship_listings(self, page_num: int) -> List[Traineeship]:
+        """Scrape the traineeship listings from a specific page."""
+        url = self._page_url(page_num)
+        
+        if self.checkpoint:
+            traineeships = self.checkpoint.get_page(page_num)
+            if traineeships is not None:
+                logger.info("Page %d already scraped, %d traineeships", page_num, len(traineeships))
+                return traineeships
+            
+        logger.info("Scraping page %d: %s", page_num, url)
+        
+        try:
+            if page_num == 1 and self._first_page is not None:
+                # get_total_pages already downloaded and parsed this page
+                page, self._first_page = self._first_page, None
+            else:
+                page = self._parse(parse_listing_page, self._fetch(url), page_num, self.parser)
+            
+            traineeships = page["traineeships"]
+            if traineeships:
+                logger.debug("Extracted %d traineeships from page %d", len(traineeships), page_num)
+                if self.checkpoint:
+                    self.checkpoint.add_page(page_num, traineeships)
             
             return traineeships
             
         except requests.RequestException as e:
-            print(f"Error fetching page {page_num}: {e}")
+            logger.error("Error fetching page %d: %s", page_num, e)
             return []
 
-    def get_traineeship_details(self, traineeship: Dict[str, Any]) -> Dict[str, Any]:
+    def get_traineeship_details(self, traineeship: Traineeship) -> Traineeship:
         """Get detailed information for a specific traineeship."""
-        url = traineeship["url"]
-        print(f"Getting details for: {traineeship['title']}")
+        url = traineeship.url
+        if self.checkpoint:
+            result = self.checkpoint.get_details(url)
+            if result is not None:
+                return result
         
-        time.sleep(random.uniform(1, 3))
+        logger.debug("Getting details for: %s", traineeship.title)
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Make a copy of existing data to preserve it
-            result = traineeship.copy()
-            
-            # Updated field selectors - removed unwanted fields including start_date
-            fields = {
-                "post_date": ".field-name-field-date-posted .field-item, .date-posted",
-                "duration": ".field-name-field-duration .field-item, .duration",
-                "description": ".field-name-body .field-item, .description",
-            }
-            
-            details = {}
-            for field_name, selector in fields.items():
-                # Skip fields that already have valid data
-                if field_name in result and result[field_name] != "Not specified":
-                    continue
-                    
-                elements = soup.select(selector)
-                if elements:
-                    if field_name == "website":
-                        details[field_name] = elements[0].get('href', '')
-                    else:
-                        # Clean up the text content
-                        text = elements[0].get_text(strip=True, separator=' ')
-                        # Remove field labels if present
-                        if ':' in text:
-                            text = text.split(':', 1)[1].strip()
-                        details[field_name] = text
-                else:
-                    details[field_name] = "Not specified"
+            stop_after = None
+            if self.stream_details:
+                # extract_details only looks for the fields the listing didn't have
+                stop_after = [classes for field, classes in DETAIL_FIELD_CLASSES.items()
+                              if getattr(traineeship, field) in (None, "Not specified")]
+            
+            html = self._fetch(url, use_cache=True, stop_after=stop_after)
+            result = self._parse(parse_detail_page, html, traineeship, self.parser)["traineeship"]
             
-            # Only update fields that are not already defined with valid data
-            for key, value in details.items():
-                if key not in result or result[key] == "Not specified":
-                    result[key] = value
+            if self.checkpoint:
+                self.checkpoint.add_details(url, result)
             
             return result
             
         except requests.RequestException as e:
-            print(f"Error fetching details for {url}: {e}")
+            logger.warning("Error fetching details for %s: %s", url, e)
             return traineeship
 
-    def scrape_all(self, max_pages: Optional[int] = None, get_details: bool = True) -> List[Dict[str, Any]]:
+    def get_traineeship_details_parallel(self, traineeships: List[Traineeship],
+                                         executor: Optional[ThreadPoolExecutor] = None) -> List[Traineeship]:
+        """
+        Get detailed information for several traineeships.
+        
+        Args:
+            traineeships: Traineeships from the listing pages
+            executor: Thread pool to fetch the details on (None to fetch them one by one)
+            
+        Returns:
+            The detailed traineeships, in the same order as the input
+        """
+        if executor is None:
+            return [self.get_traineeship_details(t) for t in traineeships]
+        return list(executor.map(self.get_traineeship_details, traineeships))
+
+    def scrape_all(self, max_pages: Optional[int] = None, get_details: bool = True,
+                   detail_workers: int = 1, pipeline: bool = False,
+                   queue_size: int = 50, known_urls: Optional[Container[str]] = None) -> List[Traineeship]:
         """
         Scrape all traineeship listings from the website.
         
+        Takes the same arguments as iter_traineeships.
+        
+        Returns:
+            A list of Traineeship records
+        """
+        return list(self.iter_traineeships(max_pages=max_pages, get_details=get_details,
+                                           detail_workers=detail_workers, pipeline=pipeline,
+                                           queue_size=queue_size, known_urls=known_urls))
+
+    def iter_traineeships(self, max_pages: Optional[int] = None, get_details: bool = True,
+                          detail_workers: int = 1, pipeline: bool = False,
+                          queue_size: int = 50, known_urls: Optional[Container[str]] = None) -> Iterator[Traineeship]:
+        """
+        Scrape the traineeship listings, yielding each one as soon as it is complete.
+        
+        Traineeships come in the same order as scrape_all returns them. Only the
+        pages and details in flight are kept in memory, so the traineeships can
+        be saved or processed while the crawl goes on.
+        
         Args:
             max_pages: Maximum number of pages to scrape (None for all)
             get_details: Whether to fetch detailed information for each listing
+            detail_workers: Number of threads fetching detail pages concurrently
+            pipeline: Walk listing pages while details are being fetched instead of
+                finishing each page's details before requesting the next page
+            queue_size: Maximum number of listings waiting for details when pipelining
+            known_urls: URLs scraped by a previous run, such as a set or a TraineeshipStore.
+                Known listings are skipped and paging stops at the first page that
+                holds only known listings
             
-        Returns:
-            A list of dictionaries with traineeship information
+        Yields:
+            Traineeship records
         """
         total_pages = self.get_total_pages()
-        print(f"Found {total_pages} pages of traineeships")
+        logger.info("Found %d pages of traineeships", total_pages)
         
         if max_pages is not None and max_pages > 0:
             total_pages = min(total_pages, max_pages)
-            print(f"Will scrape the first {total_pages} pages")
+            logger.info("Will scrape the first %d pages", total_pages)
+        
+        if get_details and pipeline:
+            yield from self._iter_pipelined(total_pages, detail_workers, queue_size, known_urls)
+            return
         
-        all_traineeships = []
+        # Detail pages dominate crawl time, so fetch them on a shared thread pool
+        executor = None
+        if get_details and detail_workers > 1:
+            self._size_connection_pool(detail_workers)
+            executor = ThreadPoolExecutor(max_workers=detail_workers)
         
+        try:
+            yield from self._iter_pages(total_pages, get_details, executor, known_urls)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    @staticmethod
+    def _drop_known(traineeships: List[Traineeship],
+                    known_urls: Optional[Container[str]]) -> Optional[List[Traineeship]]:
+        """
+        Drop the listings of a page that a previous run already scraped.
+        
+        Args:
+            traineeships: Traineeships from one listing page
+            known_urls: URLs scraped by a previous run (None to keep everything)
+            
+        Returns:
+            The listings with an unknown URL, or None if every listing on the page
+            is known and paging should stop
+        """
+        if known_urls is None:
+            return traineeships
+        new_traineeships = [t for t in traineeships if t.url not in known_urls]
+        if traineeships and not new_traineeships:
+            return None
+        return new_traineeships
+
+    def _iter_pages(self, total_pages: int, get_details: bool,
+                    executor: Optional[ThreadPoolExecutor],
+                    known_urls: Optional[Container[str]] = None) -> Iterator[Traineeship]:
+        """Scrape listing pages one after another, fetching details on the given executor."""
         # Scrape each page
         for page in range(1, total_pages + 1):
-            traineeships_on_page = self.scrape_traineeship_listings(page)
-            print(f"Found {len(traineeships_on_page)} traineeships on page {page}")
+            traineeships_on_page = self._drop_known(self.scrape_traineeship_listings(page), known_urls)
+            if traineeships_on_page is None:
+                logger.info("All traineeships on page %d are already known, stopping", page)
+                break
+            logger.info("Found %d traineeships on page %d", len(traineeships_on_page), page)
             
-            # Print sample to confirm initial data was scraped correctly
+            # Log a sample to confirm initial data was scraped correctly
             if traineeships_on_page:
-                print("\nSample traineeship from page (before details):")
                 sample = traineeships_on_page[0]
-                print(f"  Title: {sample.get('title')}")
-                print(f"  Duration: {sample.get('duration')}")
-                print(f"  Post date: {sample.get('post_date')}")
-                print(f"  Deadline: {sample.get('deadline')}")
+                logger.debug("Sample traineeship from page %d (before details) - Title: %s, Duration: %s, "
+                             "Post date: %s, Deadline: %s", page, sample.get('title'), sample.get('duration'),
+                             sample.get('post_date'), sample.get('deadline'))
             
             # Get detailed information for each traineeship if requested
             if get_details and traineeships_on_page:
-                detailed_traineeships = []
-                for traineeship in traineeships_on_page:
-                    detailed = self.get_traineeship_details(traineeship)
-                    detailed_traineeships.append(detailed)
-                all_traineeships.extend(detailed_traineeships)
+                yield from self.get_traineeship_details_parallel(traineeships_on_page, executor)
             else:
-                all_traineeships.extend(traineeships_on_page)
+                yield from traineeships_on_page
+
+    def _iter_pipelined(self, total_pages: int, detail_workers: int, queue_size: int,
+                        known_urls: Optional[Container[str]] = None) -> Iterator[Traineeship]:
+        """
+        Scrape listing pages on one thread while other threads fetch the details.
+        
+        The listing stage pushes each traineeship onto a bounded queue and blocks
+        when the detail stage falls behind, so the number of listings in flight
+        stays constant however many pages are crawled.
+        
+        Args:
+            total_pages: Number of listing pages to scrape
+            detail_workers: Number of threads fetching detail pages
+            queue_size: Maximum number of listings waiting for details
+            known_urls: URLs scraped by a previous run (see iter_traineeships)
             
-            # Be nice to the website by adding a delay between pages
-            if page < total_pages:
-                delay = random.uniform(2, 5)
-                print(f"Waiting {delay:.2f} seconds before next page...")
-                time.sleep(delay)
+        Yields:
+            Traineeship records, in listing order
+        """
+        workers = max(1, detail_workers)
+        self._size_connection_pool(workers + 1)
+        
+        pending: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        finished: queue.Queue = queue.Queue()
+        errors: List[BaseException] = []
+        # Set when the consumer stops early or a stage fails
+        stop = threading.Event()
         
+        def walk_pages():
+            index = 0
+            try:
+                for page in range(1, total_pages + 1):
+                    if stop.is_set():
+                        break
+                    traineeships_on_page = self._drop_known(self.scrape_traineeship_listings(page), known_urls)
+                    if traineeships_on_page is None:
+                        logger.info("All traineeships on page %d are already known, stopping", page)
+                        break
+                    logger.info("Found %d traineeships on page %d", len(traineeships_on_page), page)
+                    for traineeship in traineeships_on_page:
+                        pending.put((index, traineeship))
+                        index += 1
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                # One end marker per detail worker
+                for _ in range(workers):
+                    pending.put(None)
+        
+        def fetch_details():
+            while True:
+                item = pending.get()
+                if item is None:
+                    finished.put(None)
+                    return
+                if stop.is_set():
+                    # Keep draining so the listing stage never blocks on a full queue
+                    continue
+                index, traineeship = item
+                try:
+                    finished.put((index, self.get_traineeship_details(traineeship)))
+                except BaseException as e:
+                    errors.append(e)
+                    stop.set()
+        
+        threads = [threading.Thread(target=walk_pages, name="listing-pages")]
+        threads += [threading.Thread(target=fetch_details, name=f"details-{i}") for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        
+        # Details finish out of order, hold them back until the ones before are done
+        done: Dict[int, Traineeship] = {}
+        next_index = 0
+        running = workers
+        try:
+            while running and not errors:
+                item = finished.get()
+                if item is None:
+                    running -= 1
+                    continue
+                index, traineeship = item
+                done[index] = traineeship
+                while next_index in done:
+                    yield done.pop(next_index)
+                    next_index += 1
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        
+        if errors:
+            raise errors[0]
+
+    def _size_connection_pool(self, max_connections: int) -> None:
+        """Make the session keep enough pooled connections for concurrent requests."""
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    async def scrape_all_async(self, max_pages: Optional[int] = None, get_details: bool = True,
+                               concurrency: int = 8, per_host: int = 4,
+                               known_urls: Optional[Container[str]] = None) -> List[Traineeship]:
+        """
+        Scrape all traineeship listings with several requests in flight at once.
+
+        Listing pages and detail pages are fetched concurrently on a thread pool
+        that shares the session. Each request still waits for the rate limiter
+        while holding its slot, so throughput is bounded by the politeness budget
+        rather than by serial round-trips.
+
+        Args:
+            max_pages: Maximum number of pages to scrape (None for all)
+            get_details: Whether to fetch detailed information for each listing
+            concurrency: Maximum number of requests in flight overall
+            per_host: Maximum number of requests in flight to a single host
+            known_urls: URLs scraped by a previous run (see scrape_all). Listing
+                pages are then requested in batches of `concurrency` so paging
+                can stop early
+
+        Returns:
+            A list of Traineeship records, in the same
+            order as scrape_all would return them
+        """
+        concurrency = max(1, concurrency)
+        per_host = max(1, min(per_host, concurrency))
+        self._size_connection_pool(concurrency)
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        slots = asyncio.Semaphore(concurrency)
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+
+        tasks: List[asyncio.Future] = []
+
+        async def run(url: str, func, *args):
+            host = urlparse(url).netloc
+            if host not in host_slots:
+                host_slots[host] = asyncio.Semaphore(per_host)
+            async with slots, host_slots[host]:
+                return await loop.run_in_executor(executor, func, *args)
+
+        def gather(coros) -> asyncio.Future:
+            """Run coroutines concurrently, keeping their tasks so they can be cancelled."""
+            batch = [asyncio.ensure_future(coro) for coro in coros]
+            tasks.extend(batch)
+            return asyncio.gather(*batch)
+
+        try:
+            total_pages = await loop.run_in_executor(executor, self.get_total_pages)
+            logger.info("Found %d pages of traineeships", total_pages)
+
+            if max_pages is not None and max_pages > 0:
+                total_pages = min(total_pages, max_pages)
+                logger.info("Will scrape the first %d pages", total_pages)
+
+            all_traineeships = []
+            batch_size = concurrency if known_urls is not None else total_pages
+            for first_page in range(1, total_pages + 1, batch_size):
+                batch = range(first_page, min(first_page + batch_size, total_pages + 1))
+                pages = await gather(
+                    run(self.base_url, self.scrape_traineeship_listings, page)
+                    for page in batch
+                )
+                caught_up = False
+                for page, traineeships_on_page in zip(batch, pages):
+                    traineeships_on_page = self._drop_known(traineeships_on_page, known_urls)
+                    if traineeships_on_page is None:
+                        logger.info("All traineeships on page %d are already known, stopping", page)
+                        caught_up = True
+                        break
+                    all_traineeships.extend(traineeships_on_page)
+                if caught_up:
+                    break
+            logger.info("Found %d traineeships", len(all_traineeships))
+
+            if get_details and all_traineeships:
+                all_traineeships = list(await gather(
+                    run(t.url, self.get_traineeship_details, t)
+                    for t in all_traineeships
+                ))
+        finally:
+            # If a request failed the crawl (e.g. CrawlAborted), stop the ones
+            # that haven't started and wait for those in flight, so no request
+            # is made once the crawl is over
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=True, cancel_futures=True)
+
         return all_traineeships
 
-    def save_to_csv(self, traineeships: List[Dict[str, Any]], filename: str = None) -> str:
+    def save_to_csv(self, traineeships: List[Traineeship], filename: str = None) -> str:
         """
         Save the traineeships to a CSV file.
         
         Args:
-            traineeships: List of traineeship dictionaries
+            traineeships: List of Traineeship records
             filename: Output filename (default: erasmusintern_traineeships_YYYY-MM-DD.csv)
             
         Returns:
             The filename the data was saved to
         """
         if not traineeships:
-            print("No traineeships to save")
+            logger.warning("No traineeships to save")
             return ""
             
         if not filename:
@@ -361,44 +985,43 @@ class ErasmusInternScraper:
                 # File is locked or we don't have permission, create a new filename
                 base, ext = os.path.splitext(filename)
                 filename = f"{base}_new{ext}"
-                print(f"Original file is locked. Using new filename: {filename}")
+                logger.warning("Original file is locked. Using new filename: %s", filename)
         
+        df = pd.DataFrame([t.to_dict() for t in traineeships])
         try:
-            df = pd.DataFrame(traineeships)
             df.to_csv(filename, index=False, encoding='utf-8')
-            print(f"Saved {len(traineeships)} traineeships to {filename}")
+            logger.info("Saved %d traineeships to %s", len(traineeships), filename)
             return filename
         except PermissionError:
             # If we still have permission issues, try with a different name in user directory
             import tempfile
             temp_dir = tempfile.gettempdir()
             backup_filename = os.path.join(temp_dir, f"erasmusintern_backup_{date_str}.csv")
-            print(f"Permission denied. Saving to alternate location: {backup_filename}")
-            df = pd.DataFrame(traineeships)
+            logger.warning("Permission denied. Saving to alternate location: %s", backup_filename)
             df.to_csv(backup_filename, index=False, encoding='utf-8')
             return backup_filename
         except Exception as e:
-            print(f"Error saving file: {e}")
+            logger.error("Error saving file: %s", e)
             # Last resort - save to current directory
             fallback_file = f"erasmusintern_traineeships_fallback_{date_str}.csv"
-            print(f"Attempting to save to current directory: {fallback_file}")
-            df = pd.DataFrame(traineeships)
+            logger.warning("Attempting to save to current directory: %s", fallback_file)
             df.to_csv(fallback_file, index=False, encoding='utf-8')
             return fallback_file
 
-    def save_to_json(self, traineeships: List[Dict[str, Any]], filename: str = None) -> str:
+    def save_to_json(self, traineeships: List[Traineeship], filename: str = None, pretty: bool = False) -> str:
         """
         Save the traineeships to a JSON file.
         
         Args:
-            traineeships: List of traineeship dictionaries
+            traineeships: List of Traineeship records
             filename: Output filename (default: erasmusintern_traineeships_YYYY-MM-DD.json)
+            pretty: Indent the JSON by four spaces instead of writing it compactly
             
         Returns:
             The filename the data was saved to
         """
         if not traineeships:
-            print("No traineeships to save")
+            logger.warning("No traineeships to save")
             return ""
             
         if not filename:
@@ -409,20 +1032,75 @@ class ErasmusInternScraper:
         # Make sure the directory exists
         os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
         
+        records = [t.to_dict() for t in traineeships]
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(traineeships, f, indent=4, ensure_ascii=False)
-            print(f"Saved {len(traineeships)} traineeships to {filename}")
+            jsonio.dump(records, filename, pretty=pretty)
+            logger.info("Saved %d traineeships to %s", len(traineeships), filename)
             return filename
         except PermissionError:
             # Try with a different name in temp directory
             import tempfile
             temp_dir = tempfile.gettempdir()
             backup_filename = os.path.join(temp_dir, f"erasmusintern_backup_{date_str}.json")
-            print(f"Permission denied. Saving to alternate location: {backup_filename}")
-            with open(backup_filename, 'w', encoding='utf-8') as f:
-                json.dump(traineeships, f, indent=4, ensure_ascii=False)
+            logger.warning("Permission denied. Saving to alternate location: %s", backup_filename)
+            jsonio.dump(records, backup_filename, pretty=pretty)
             return backup_filename
         except Exception as e:
-            print(f"Error saving file: {e}")
-            return ""
\ No newline at end of file
+            logger.error("Error saving file: %s", e)
+            return ""
+
+    def save_to_jsonl(self, traineeships: List[Traineeship], filename: str = None, append: bool = False) -> str:
+        """
+        Save the traineeships to a JSON Lines file, one record per line.
+        
+        Args:
+            traineeships: List of Traineeship records
+            filename: Output filename ending in .jsonl, or .jsonl.gz or .jsonl.zst to
+                compress it (default: erasmusintern_traineeships_YYYY-MM-DD.jsonl)
+            append: Add the traineeships to the end of an existing file
+            
+        Returns:
+            The filename the data was saved to
+        """
+        if not traineeships:
+            logger.warning("No traineeships to save")
+            return ""
+        
+        if not filename:
+            date_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            filename = os.path.join(self.data_dir, f"erasmusintern_traineeships_{date_str}.jsonl")
+        
+        with JsonLinesStreamWriter(filename, append=append) as writer:
+            for traineeship in traineeships:
+                writer.write(traineeship.to_dict())
+        logger.info("Saved %d traineeships to %s", len(traineeships), filename)
+        return filename
+
+    def save_to_parquet(self, traineeships: List[Traineeship], filename: str = None) -> str:
+        """
+        Save the traineeships to a Parquet file, with the repetitive fields dictionary-encoded.
+        
+        Needs the pyarrow package.
+        
+        Args:
+            traineeships: List of Traineeship records
+            filename: Output filename (default: erasmusintern_traineeships_YYYY-MM-DD.parquet)
+            
+        Returns:
+            The filename the data was saved to
+        """
+        if not traineeships:
+            logger.warning("No traineeships to save")
+            return ""
+        
+        if not filename:
+            date_str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            filename = os.path.join(self.data_dir, f"erasmusintern_traineeships_{date_str}.parquet")
+        
+        records = [t.to_dict() for t in traineeships]
+        fieldnames = list(dict.fromkeys(key for record in records for key in record))
+        with ParquetStreamWriter(filename, fieldnames) as writer:
+            for record in records:
+                writer.write(record)
+        logger.info("Saved %d traineeships to %s", len(traineeships), filename)
+        return filename
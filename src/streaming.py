@@ -0,0 +1,111 @@
+import codecs
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Tuple
+
+import requests
+
+
+# Elements that never have an end tag
+_VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+
+class FieldWatcher(HTMLParser):
+    """
+    Follows an HTML document while it is downloaded and tells when the blocks
+    holding the wanted fields have all been read.
+
+    Each field is given as a group of classes, and any element with one of
+    them is a block of that field. A field has been read once one of its
+    blocks has been closed while no other block of it is still open.
+    """
+
+    def __init__(self, field_classes: Iterable[Iterable[str]]):
+        """
+        Initialize the watcher.
+
+        Args:
+            field_classes: One group of classes per wanted field
+        """
+        self.field_classes = [frozenset(classes) for classes in field_classes]
+        super().__init__(convert_charrefs=False)
+
+    def reset(self) -> None:
+        """Forget everything fed so far."""
+        super().reset()
+        # Number of open elements per tag name, to tell which element an end tag closes
+        self._depth: Dict[str, int] = {}
+        # Open blocks as (tag, depth, field)
+        self._open: List[Tuple[str, int, int]] = []
+        self._read = [False] * len(self.field_classes)
+        self.done = not self.field_classes
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        if tag in _VOID_ELEMENTS:
+            return
+        depth = self._depth.get(tag, 0) + 1
+        self._depth[tag] = depth
+
+        classes = set()
+        for name, value in attrs:
+            if name == "class" and value:
+                classes.update(value.split())
+        if not classes:
+            return
+        for field, wanted in enumerate(self.field_classes):
+            if not self._read[field] and not wanted.isdisjoint(classes):
+                self._open.append((tag, depth, field))
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        # In HTML the slash of <div/> is ignored, the element stays open
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        depth = self._depth.get(tag, 0)
+        if not depth:
+            return
+        self._depth[tag] = depth - 1
+
+        # Blocks nested deeper than the closed element were left unclosed and end with it
+        closed = [block for block in self._open if block[0] == tag and block[1] >= depth]
+        if not closed:
+            return
+        self._open = [block for block in self._open if block not in closed]
+        still_open = {field for _, _, field in self._open}
+        for _, _, field in closed:
+            if field not in still_open:
+                self._read[field] = True
+        self.done = all(self._read)
+
+
+def read_until_done(response: requests.Response, watcher: FieldWatcher, chunk_size: int = 16 * 1024) -> None:
+    """
+    Read a streamed response until the watcher has seen all its fields, then close it.
+
+    The rest of the body is never downloaded. The part that was read becomes
+    the response's content, so response.text works as usual.
+
+    Args:
+        response: A response requested with stream=True
+        watcher: The watcher to feed the body to, reset before reading
+        chunk_size: Number of bytes to read at a time
+    """
+    watcher.reset()
+    try:
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    chunks = []
+    for chunk in response.iter_content(chunk_size):
+        chunks.append(chunk)
+        watcher.feed(decoder.decode(chunk))
+        if watcher.done:
+            break
+
+    # Closing a response that wasn't read to the end drops its connection
+    response.close()
+    # requests has no public way to set the body of a streamed response
+    response._content = b"".join(chunks)
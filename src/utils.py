@@ -1,9 +1,14 @@
 import os
-import json
+import hashlib
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
+from src import jsonio
+from src.jsonl import is_jsonl, iter_jsonl
+from src.records import Traineeship
+
 
 def load_config() -> Dict[str, Any]:
     """
@@ -20,8 +25,23 @@ def load_config() -> Dict[str, Any]:
         "groq_api_key": os.environ.get("GROQ_API_KEY", ""),
         "base_url": os.environ.get("BASE_URL", "https://erasmusintern.org/traineeships"),
         "max_pages": int(os.environ.get("MAX_PAGES", 0)),  # 0 means all pages
-        "data_dir": os.environ.get("DATA_DIR", "data")
+        "data_dir": os.environ.get("DATA_DIR", "data"),
+        "cache_dir": os.environ.get("CACHE_DIR", ""),  # empty means <data_dir>/http_cache
+        "cache_size_mb": int(os.environ.get("CACHE_SIZE_MB", 200)),
+        "db_path": os.environ.get("DB_PATH", ""),  # empty means <data_dir>/traineeships.db
+        "rate_limit": float(os.environ.get("RATE_LIMIT", 0.5)),  # requests per second, 0 means no limit
+        "rate_burst": int(os.environ.get("RATE_BURST", 2)),
+        "max_rate_limit": float(os.environ.get("MAX_RATE_LIMIT", 4.0)),
+        "max_retries": int(os.environ.get("MAX_RETRIES", 3)),
+        "error_budget": int(os.environ.get("ERROR_BUDGET", 100)),  # 0 means no limit
+        "breaker_threshold": int(os.environ.get("BREAKER_THRESHOLD", 5)),
+        "breaker_cooldown": float(os.environ.get("BREAKER_COOLDOWN", 60)),
+        "html_parser": os.environ.get("HTML_PARSER", "html.parser")
     }
+    if not config["cache_dir"]:
+        config["cache_dir"] = os.path.join(config["data_dir"], "http_cache")
+    if not config["db_path"]:
+        config["db_path"] = os.path.join(config["data_dir"], "traineeships.db")
     
     return config
 
@@ -41,8 +61,9 @@ def validate_config(config: Dict[str, Any]) -> bool:
         print("ERROR: GROQ API key is not set. Set it in .env file or as environment variable.")
         return False
     
-    # Check if base URL is set and valid
-    if not config["base_url"] or not config["base_url"].startswith("https://erasmusintern.org"):
+    # Check if base URL is set and valid (local URLs are allowed for benchmarks.mock_server)
+    local_prefixes = ("http://127.0.0.1", "http://localhost")
+    if not config["base_url"] or not config["base_url"].startswith(("https://erasmusintern.org",) + local_prefixes):
         print("ERROR: Invalid base URL. Must be a valid erasmusintern.org URL.")
         return False
     
@@ -81,6 +102,34 @@ def get_most_recent_data_file(data_dir: str, file_pattern: str = "erasmusintern_
     return sorted(files)[-1]
 
 
+def load_traineeships(file_path: str) -> List[Traineeship]:
+    """
+    Load previously scraped traineeships from a CSV, JSON, JSON Lines or Parquet file
+    
+    Args:
+        file_path: Path to a file written by the scraper
+        
+    Returns:
+        List of Traineeship records, or an empty list if the file can't be read
+    """
+    try:
+        if file_path.endswith('.json'):
+            return [Traineeship.from_dict(t) for t in jsonio.load(file_path)]
+        if is_jsonl(file_path):
+            return [Traineeship.from_dict(t) for t in iter_jsonl(file_path)]
+        if file_path.endswith('.parquet'):
+            from src.parquet import read_parquet
+            return read_parquet(file_path)
+        
+        import pandas as pd
+        # Keep empty cells as strings so records round-trip like the scraper wrote them
+        df = pd.read_csv(file_path, keep_default_na=False)
+        return [Traineeship.from_dict(t) for t in df.to_dict('records')]
+    except Exception as e:
+        print(f"Error loading traineeships from {file_path}: {e}")
+        return []
+
+
 def create_timestamp_filename(prefix: str, extension: str, data_dir: str = "data") -> str:
     """
     Create a filename with a timestamp
@@ -103,4 +152,33 @@ def create_timestamp_filename(prefix: str, extension: str, data_dir: str = "data
     filename = f"{prefix}_{timestamp}.{extension}"
     
     # Return full path
-    return os.path.join(data_dir, filename)
\ No newline at end of file
+    return os.path.join(data_dir, filename)
+
+
+def url_file_name(url: str, extension: str) -> str:
+    """
+    Get the name of the file a page is stored in, from the SHA-1 hash of its URL
+    
+    Args:
+        url: URL of the page
+        extension: File extension (with the dot)
+        
+    Returns:
+        The file name
+    """
+    return hashlib.sha1(url.encode('utf-8')).hexdigest() + extension
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """
+    Write a file through a temporary file, so a crash never leaves a partial file
+    
+    Args:
+        path: Path of the file, which is replaced if it exists
+        data: Contents of the file
+    """
+    # The thread id keeps threads writing the same file from sharing a temporary file
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
\ No newline at end of file
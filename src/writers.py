@@ -0,0 +1,174 @@
+import os
+import csv
+from typing import IO, Any, Dict, List
+
+from src import jsonio
+from src.jsonl import open_jsonl
+
+
+class StreamWriter:
+    """
+    Writes traineeships to a file one at a time, while they are being scraped.
+
+    The file is written under a temporary ".part" name and only gets its real
+    name on commit(), so a crawl that fails halfway never leaves behind a
+    dataset that looks complete. Used as a context manager, the file is
+    committed when the block ends normally and discarded when it raises.
+    Formats whose every record stands on its own set `keeps_partial`: they are
+    written under their real name and kept when the block raises.
+    """
+
+    keeps_partial = False
+
+    def __init__(self, path: str):
+        """Start writing the file at the given path."""
+        self.path = path
+        self.count = 0
+        self._part_path = path if self.keeps_partial else f"{path}.part"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = self._open(self._part_path)
+        self._start()
+
+    def _open(self, path: str) -> IO[str]:
+        """Open the file to write to."""
+        return open(path, 'w', encoding='utf-8', newline='')
+
+    def _start(self) -> None:
+        """Write whatever comes before the first record."""
+
+    def _write(self, traineeship: Dict[str, Any]) -> None:
+        """Write one record."""
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        """Write whatever comes after the last record."""
+
+    def write(self, traineeship: Dict[str, Any]) -> None:
+        """Add a traineeship to the file."""
+        self._write(traineeship)
+        self.count += 1
+
+    def commit(self) -> str:
+        """
+        Finish the file and give it its real name.
+
+        Returns:
+            The path of the file
+        """
+        if not self._file.closed:
+            self._finish()
+            self._file.close()
+            if self._part_path != self.path:
+                os.replace(self._part_path, self.path)
+        return self.path
+
+    def discard(self) -> None:
+        """Stop writing and remove the unfinished file."""
+        if not self._file.closed:
+            self._file.close()
+            os.remove(self._part_path)
+
+    def __enter__(self) -> "StreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None or self.keeps_partial:
+            self.commit()
+        else:
+            self.discard()
+
+
+class CsvStreamWriter(StreamWriter):
+    """Writes traineeships as rows of a CSV file with a fixed set of columns."""
+
+    def __init__(self, path: str, fieldnames: List[str]):
+        """
+        Start writing a CSV file.
+
+        Args:
+            path: Path of the file
+            fieldnames: Columns of the file. Missing fields are left empty and
+                fields that aren't columns are left out
+        """
+        self.fieldnames = fieldnames
+        super().__init__(path)
+
+    def _start(self) -> None:
+        # Same line endings as pandas' to_csv
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore',
+                                      lineterminator=os.linesep)
+        self._writer.writeheader()
+
+    def _write(self, traineeship: Dict[str, Any]) -> None:
+        self._writer.writerow(traineeship)
+
+
+class JsonStreamWriter(StreamWriter):
+    """
+    Writes traineeships as a JSON array.
+
+    The array is compact, the same text as jsonio.dumps(traineeships), or
+    formatted like json.dump(traineeships, f, indent=4) when pretty.
+    """
+
+    def __init__(self, path: str, pretty: bool = False):
+        """
+        Start writing a JSON file.
+
+        Args:
+            path: Path of the file
+            pretty: Indent the JSON by four spaces instead of writing it compactly
+        """
+        self.pretty = pretty
+        super().__init__(path)
+
+    def _start(self) -> None:
+        self._file.write("[")
+
+    def _write(self, traineeship: Dict[str, Any]) -> None:
+        if self.pretty:
+            text = jsonio.dumps(traineeship, pretty=True)
+            self._file.write(("," if self.count else "") + "\n    " + text.replace("\n", "\n    "))
+        else:
+            self._file.write(("," if self.count else "") + jsonio.dumps(traineeship))
+
+    def _finish(self) -> None:
+        self._file.write("\n]" if self.pretty and self.count else "]")
+
+
+class JsonLinesStreamWriter(StreamWriter):
+    """
+    Writes traineeships as JSON Lines, one compact JSON object per line.
+
+    Every record is flushed as soon as it is written, so the file can be read
+    while the crawl is running and everything written before a crash is kept.
+    Files ending in .gz or .zst are compressed (see src.jsonl.open_jsonl).
+    """
+
+    keeps_partial = True
+
+    def __init__(self, path: str, append: bool = False):
+        """
+        Start writing a JSON Lines file.
+
+        Args:
+            path: Path of the file
+            append: Add the records to the end of an existing file instead of
+                replacing it
+        """
+        self.append = append
+        super().__init__(path)
+
+    def _open(self, path: str) -> IO[str]:
+        return open_jsonl(path, 'a' if self.append else 'w')
+
+    def _write(self, traineeship: Dict[str, Any]) -> None:
+        self._file.write(jsonio.dumps(traineeship) + "\n")
+        self._file.flush()
+
+    def discard(self) -> None:
+        """Stop writing and remove the file, unless the records were appended to an existing one."""
+        if not self.append:
+            super().discard()
+        elif not self._file.closed:
+            self._file.close()
@@ -0,0 +1,40 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.mock_server import MockServer
+from main import scrape_command, setup_argparse
+from src.utils import load_config
+
+
+class NoCommandTest(unittest.TestCase):
+    def test_no_command_has_the_scrape_defaults(self):
+        parser = setup_argparse()
+        args = vars(parser.parse_args([]))
+        for name, value in vars(parser.parse_args(["scrape"])).items():
+            if name != "command":
+                self.assertEqual(args[name], value, name)
+
+    def test_no_command_scrapes(self):
+        with MockServer(listings=5) as server, tempfile.TemporaryDirectory() as data_dir:
+            env = {"BASE_URL": server.url, "DATA_DIR": data_dir, "RATE_LIMIT": "0", "MAX_PAGES": "0"}
+            with mock.patch.dict(os.environ, env):
+                config = load_config()
+            args = setup_argparse().parse_args([])
+            args.quiet = True
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                scrape_command(args, config)
+
+            self.assertIn("Data saved to", output.getvalue())
+            self.assertNotIn("Error during scraping", output.getvalue())
+            saved = [name for name in os.listdir(data_dir) if name.endswith((".csv", ".json"))]
+            self.assertEqual(len(saved), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import threading
+import time
+import unittest
+
+from src.rate_limit import AdaptiveRateLimiter
+
+
+class PauseTest(unittest.TestCase):
+    def test_requests_after_a_pause_are_spaced_at_the_rate(self):
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=2, min_rate=1.0, max_rate=10.0)
+        start = time.monotonic()
+        limiter.on_response(429, 0.1, "1")
+        rate = limiter.rate
+
+        released = []
+        lock = threading.Lock()
+
+        def request():
+            limiter.acquire()
+            with lock:
+                released.append(time.monotonic() - start)
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        released.sort()
+        self.assertGreaterEqual(released[0], 1.0)
+        for earlier, later in zip(released, released[1:]):
+            self.assertAlmostEqual(later - earlier, 1 / rate, delta=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()